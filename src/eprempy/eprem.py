@@ -76,11 +76,14 @@ class Observer(collections.abc.Mapping):
 
     def __getitem__(self, key: str, /):
         """Retrieve the named quantity, if possible."""
-        if key in self._observables:
+        # NOTE: `self._observables` caches each quantity by key, so a single
+        # subscription both checks for and retrieves the quantity.
+        try:
             return self._observables[key]
-        raise KeyError(
-            f"No observable quantity for {key!r}"
-        ) from None
+        except KeyError:
+            raise KeyError(
+                f"No observable quantity for {key!r}"
+            ) from None
 
     @property
     def times(self) -> physical.Coordinates:
@@ -113,7 +116,9 @@ class Observer(collections.abc.Mapping):
     def _get_axis(self, name: str):
         """Internal helper for axis properties."""
         if self._axes is None:
-            self._axes = datafile.axes(self.source, self.system)
+            # Share the axes that our observable quantities index, rather than
+            # reading the same axes from the dataset a second time.
+            self._axes = self._observables.axes
         return self._axes[name]
 
     @property
@@ -271,6 +271,8 @@ _ST = typing.TypeVar('_ST', bound='Singleton')
 class Singleton:
     """A simple base class for creating singletons."""
 
+    __slots__ = ()
+
     _exists = False
     _instance = None
 
@@ -286,6 +288,8 @@ class Singleton:
 class NothingType(Singleton):
     """An object that represents nothing in a variety of ways."""
 
+    __slots__ = ()
+
     def __getitem__(self, index: typing.Any) -> None:
         """Return `None`, regardless of `index`."""
         return None
@@ -396,6 +400,8 @@ def _sentinel_init(f):
 class _SentinelType(typing.Generic[T]):
     """Factory class for singleton key-value pairs."""
 
+    __slots__ = ('_name', '_value')
+
     _name: str
     _value: T
 
@@ -474,12 +480,26 @@ FAIL = sentinel('FAIL', False)
 """Sentinel object equivalent to `False`."""
 
 
+_NUMBER_TYPES = frozenset((bool, int, float, complex))
+"""Built-in numeric types that `isnull` can reject without an ABC check."""
+
+_COLLECTION_TYPES = frozenset((str, list, tuple, dict, set, frozenset))
+"""Built-in types for which `isnull` is equivalent to `not this`."""
+
+
 def isnull(this: typing.Any) -> bool:
     """True if `this` is empty but not if it's 0.
 
     This function allows the calling code to programmatically test for objects
     that are logically ``False`` except for numbers equivalent to 0.
     """
+    if this is None:
+        return True
+    kind = type(this)
+    if kind in _NUMBER_TYPES:
+        return False
+    if kind in _COLLECTION_TYPES:
+        return not this
     if isinstance(this, numbers.Number):
         return False
     size = getattr(this, 'size', None)
@@ -558,7 +578,10 @@ def allisinstance(types, *targets):
     """
     if not targets:
         raise TypeError("Missing object arguments") from None
-    return all(isinstance(target, types) for target in targets)
+    for target in targets:
+        if not isinstance(target, types):
+            return False
+    return True
 
 
 V = typing.TypeVar('V')
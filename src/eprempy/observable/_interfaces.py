@@ -1959,28 +1959,34 @@ def _apply_interpolation(
     """
     darray = numpy.array(data)
     rarray = numpy.array(reference)
-    interpolated = [
-        _apply_interp1d(darray, rarray, target)
-        for target in targets
-    ]
+    interp = None
+    interpolated = []
+    for target in targets:
+        if target in rarray:
+            idx = container.nearest(rarray, target).index
+            interpolated.append(darray[idx])
+            continue
+        if interp is None:
+            # Build the interpolator only when we need it, then reuse it for
+            # all remaining targets.
+            interp = _build_interp1d(darray, rarray)
+        interpolated.append(interp(target))
     if rarray.ndim == 2:
         return numpy.swapaxes(interpolated, 0, 1)
     return numpy.array(interpolated)
 
 
-def _apply_interp1d(
+def _build_interp1d(
     array: numpy.ndarray,
     reference: numpy.ndarray,
-    target: float,
-) -> typing.List[float]:
-    """Interpolate data to `target` along the leading axis."""
-    if target in reference:
-        idx = container.nearest(reference, target).index
-        return array[idx]
+) -> typing.Callable[[float], numpy.ndarray]:
+    """Create a function that interpolates data along the leading axis."""
     ndim = reference.ndim
     if ndim == 2:
         interps = [interp1d(x, y, axis=0) for x, y in zip(reference, array)]
-        return numpy.array([interp(target) for interp in interps])
+        def apply(target: float) -> numpy.ndarray:
+            return numpy.array([interp(target) for interp in interps])
+        return apply
     if ndim != 1:
         raise physical._array.NDimError(
             f"The reference array may have 1 or 2 (not {ndim}) dimensions"
@@ -1989,8 +1995,7 @@ def _apply_interp1d(
         # This works because we are interpolating over the leading dimension by
         # definition. Squeezing does not necessarily work because there may be
         # other singular dimensions.
-        return array[0]
-    interp = interp1d(reference, array, axis=0)
-    return interp(target)
+        return lambda target: array[0]
+    return interp1d(reference, array, axis=0)
 
 
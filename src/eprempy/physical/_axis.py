@@ -204,6 +204,7 @@ class Symbols(Axis[typing.List[str]]):
 
     def __init__(self, data: typing.List[str]) -> None:
         super().__init__(data)
+        self._positions = None
 
     def __getitem__(self, index, /):
         if container.isiterable(index):
@@ -217,14 +218,31 @@ class Symbols(Axis[typing.List[str]]):
             raise AxisTypeError(
                 "All index targets must be strings"
             ) from None
-        indices = [
-            self.data.index(str(target))
-            for target in targets
-        ]
+        positions = self.positions
+        indices = []
+        for target in targets:
+            # NOTE: This intentionally raises `ValueError` rather than
+            # `AxisValueError` because callers treat the latter as a request to
+            # interpolate, which is meaningless for symbols.
+            if (i := positions.get(str(target))) is None:
+                raise ValueError(
+                    f"This axis does not contain the symbol {target!r}"
+                ) from None
+            indices.append(i)
         if len(indices) == 1:
             return numeric.index.value(indices[0])
         return numeric.index.sequence(indices)
 
+    @property
+    def positions(self) -> typing.Dict[str, int]:
+        """The index of the first occurrence of each symbol."""
+        if self._positions is None:
+            positions = {}
+            for i, symbol in enumerate(self.data):
+                positions.setdefault(symbol, i)
+            self._positions = positions
+        return self._positions
+
 
 class Coordinates(Axis[measured.Sequence[numbers.Real]]):
     """The interface to a measured axis."""
@@ -341,7 +341,7 @@ def expression_factory(this, **options):
             f"Cannot update parsing options on an existing expression"
         ) from None
     string = standard(this, joiner='*')
-    terms = _init_terms(string, _parser.Parser(**options))
+    terms = _init_terms(string, _parser.parser_factory(**options))
     return Expression(terms)
 
 
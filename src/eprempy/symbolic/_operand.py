@@ -1,7 +1,9 @@
 import fractions
+import functools
 import itertools
 import numbers
 import re
+import types
 import typing
 
 from .. import etc
@@ -16,6 +18,72 @@ class OperandValueError(ValueError):
     """Value error associated with a symbolic operand."""
 
 
+_RATIONAL = r'[-+]?(?=\d|\.\d)\d*(?:(?:/\d+?)|(?:\.\d*)?(?:[eE][-+]?\d+)?)'
+"""Pattern for a rational number.
+
+Modeled after `fractions._RATIONAL_FORMAT`: an optional sign (only if followed
+by <digit> or .<digit>) and a possibly empty numerator, followed by either an
+optional denominator or an optional fractional part and an optional exponent.
+"""
+
+_BASE = r'[a-zA-Z#_]+\d*'
+"""Pattern for a base: accepted non-digit character(s) then optional digits."""
+
+_BASE_RE = re.compile(fr'({_RATIONAL}|{_BASE})')
+"""Compiled pattern that matches a valid term base."""
+
+
+def _compile_patterns(opening: str, closing: str, raising: str):
+    """Compile the operand patterns for the given separator tokens.
+
+    The returned mapping is read-only so that factories may safely share it.
+    """
+    exponent = fr'\{raising}{_RATIONAL}'
+    return types.MappingProxyType({
+        'constant': re.compile(
+            fr'(?P<coefficient>{_RATIONAL})'
+            fr'(?P<exponent>{exponent})?'
+        ),
+        'variable': re.compile(
+            fr'(?P<coefficient>{_RATIONAL})?'
+            fr'(?P<base>{_BASE})'
+            fr'(?P<exponent>{exponent})?'
+        ),
+        'complex': re.compile(
+            fr'(?P<coefficient>{_RATIONAL})?'
+            fr'(?P<base>\{opening}.+?\{closing})'
+            fr'(?P<exponent>{exponent})?'
+        ),
+        'exponent': re.compile(exponent),
+        'opening': re.compile(fr'\{opening}'),
+        'closing': re.compile(fr'\{closing}'),
+        'raising': re.compile(fr'\{raising}')
+    })
+
+
+_DEFAULT_TOKENS = ('(', ')', '^')
+"""The default opening, closing, and raising tokens."""
+
+_DEFAULT_PATTERNS = _compile_patterns(*_DEFAULT_TOKENS)
+"""Operand patterns for the default tokens, compiled once at import."""
+
+
+_ONE = fractions.Fraction(1)
+
+
+def _as_fraction(value) -> fractions.Fraction:
+    """Convert `value` to a fraction, with 1 in place of a null value.
+
+    Fractions are immutable, so this function passes existing instances (e.g.,
+    the result of arithmetic on another operand's attributes) through as-is.
+    """
+    if not value:
+        return _ONE
+    if type(value) is fractions.Fraction:
+        return value
+    return fractions.Fraction(value)
+
+
 @etc.autostr
 class Operand(_part.Part):
     """An operand in a symbolic expression.
@@ -62,20 +130,23 @@ class Operand(_part.Part):
     `~symbolic.Expression` with `~symbolic.Parser`.
     """
 
+    is_term = False
+    """True if this operand is a formally simple `~symbolic.Term`."""
+
     def __init__(
         self,
         coefficient: numbers.Real=None,
         base: str=None,
         exponent: numbers.Real=None,
     ) -> None:
-        self.coefficient = fractions.Fraction(coefficient or 1)
+        self.coefficient = _as_fraction(coefficient)
         """The numerical coefficient."""
         self.base = base or '1'
         """The base term or complex."""
-        self.exponent = fractions.Fraction(exponent or 1)
+        self.exponent = _as_fraction(exponent)
         """The numerical exponent."""
 
-    @property
+    @functools.cached_property
     def attrs(self):
         """The current coefficient, base, and exponent."""
         return (self.coefficient, self.base, self.exponent)
@@ -110,34 +181,20 @@ class Operand(_part.Part):
 
     def format(self):
         """Format this operand for printing."""
-        if self.coefficient == 1 and self.exponent == 1:
-            return self.base
-        string = f"({self.base})"
-        if self.exponent != 1:
-            string = f"{string}^{self.exponent}"
-        if self.coefficient != 1:
-            string = f"{self.coefficient}{string}"
-        return string
+        if self.coefficient == 1:
+            if self.exponent == 1:
+                return self.base
+            return f"({self.base})^{self.exponent}"
+        if self.exponent == 1:
+            return f"{self.coefficient}({self.base})"
+        return f"{self.coefficient}({self.base})^{self.exponent}"
 
 
 class OperandFactory(_part.Factory):
     """A factory that produces symbolic operands."""
 
-    rational = r""" # Modeled after `fractions._RATIONAL_FORMAT`
-        [-+]?                 # an optional sign, ...
-        (?=\d|\.\d)           # ... only if followed by <digit> or .<digit>
-        \d*                   # and a possibly empty numerator
-        (?:                   # followed by ...
-            (?:/\d+?)         # ... an optional denominator
-        |                     # OR
-            (?:\.\d*)?        # ... an optional fractional part,
-            (?:[eE][-+]?\d+)? #     and an optional exponent
-        )
-    """
-    base = r"""
-        [a-zA-Z#_]+ # one or more accepted non-digit character(s)
-        \d*         # followed by optional digits
-    """
+    rational = _RATIONAL
+    base = _BASE
 
     def __init__(
         self,
@@ -145,37 +202,26 @@ class OperandFactory(_part.Factory):
         closing: str=')',
         raising: str='^',
     ) -> None:
-        exponent = fr'\{raising}{self.rational}'
-        self.patterns = {
-            'constant': re.compile(
-                fr'(?P<coefficient>{self.rational})'
-                fr'(?P<exponent>{exponent})?',
-                re.VERBOSE,
-            ),
-            'variable': re.compile(
-                fr'(?P<coefficient>{self.rational})?'
-                fr'(?P<base>{self.base})'
-                fr'(?P<exponent>{exponent})?',
-                re.VERBOSE,
-            ),
-            'complex': re.compile(
-                fr'(?P<coefficient>{self.rational})?'
-                fr'(?P<base>\{opening}.+?\{closing})'
-                fr'(?P<exponent>{exponent})?',
-                re.VERBOSE,
-            ),
-            'exponent': re.compile(exponent, re.VERBOSE),
-            'opening': re.compile(fr'\{opening}', re.VERBOSE),
-            'closing': re.compile(fr'\{closing}', re.VERBOSE),
-            'raising': re.compile(fr'\{raising}', re.VERBOSE)
-        }
+        tokens = (opening, closing, raising)
+        self._tokens = tokens
+        self.patterns = (
+            _DEFAULT_PATTERNS if tokens == _DEFAULT_TOKENS
+            else _compile_patterns(*tokens)
+        )
         """Compiled regular expressions for symbolic operands."""
+        self._opening_ch = opening
+        self._closing_ch = closing
 
     _argtypes = {
         'coefficient': numbers.Real,
         'base': str,
         'exponent': (numbers.Real, str),
     }
+    _defaults = {
+        'coefficient': 1,
+        'base': '1',
+        'exponent': 1,
+    }
     @classmethod
     def isvalid(cls, name: str, this: typing.Any):
         """True if `this` is valid for use as the named attribute."""
@@ -312,7 +358,20 @@ class OperandFactory(_part.Factory):
         - `'(a * b^2)^3/2'` -> `1, 'a * b^2', '3/2'`
         - `'((a / b^2)^3 * c)^2'` -> `1, '(a / b^2)^3 * c', 2`
         - `'(a / b^2)^3 * c^2'` -> `1, '(a / b^2)^3 * c^2', 1`
+
+        Operands do not change after creation, so this method caches results
+        for hashable input and returns the cached operand for repeated input.
         """
+        if type(self) is not OperandFactory:
+            return self._create(args, strict)
+        try:
+            hash(args)
+        except TypeError:
+            return self._create(args, strict)
+        return _create_shared(self._tokens, args, strict)
+
+    def _create(self, args: tuple, strict: bool):
+        """Create an operand from input. See `~create`."""
         c0, b0, e0 = self.normalize(*args).values()
         ends = (b0[0], b0[-1])
         if any(self.patterns['raising'].match(c) for c in ends):
@@ -329,7 +388,7 @@ class OperandFactory(_part.Factory):
         c1, base, e1 = match.result.attrs
         coefficient = c0 * (c1 ** e0)
         exponent = e1 * e0
-        if not isinstance(match.result, Term):
+        if not match.result.is_term:
             interior = self.create(base)
             if isinstance(interior, Term):
                 coefficient *= interior.coefficient ** exponent
@@ -390,12 +449,9 @@ class OperandFactory(_part.Factory):
             found an operand in `string` (subject to any given keyword
             arguments), this method will return `None`.
         """
-        methods = (
-            self._match_simplex,
-            self._match_complex,
-        )
-        if match := etc.apply(methods, string, **kwargs):
+        if match := self._match_simplex(string, **kwargs):
             return match
+        return self._match_complex(string, **kwargs)
 
     def _match_simplex(
         self,
@@ -410,22 +466,27 @@ class OperandFactory(_part.Factory):
         This method tries to match the 'variable' pattern before the 'constant'
         pattern because `re.match` will find a match for 'constant' at the start
         of any variable term with an explicit coefficient.
+
+        A 'constant' match can only span the same text as a 'variable' match
+        when the variable's base is actually the exponent of a number in
+        scientific notation (e.g., `'1e5'`), so this method only tries the
+        'constant' pattern after a 'variable' match in that case.
         """
         target = string[start:]
-        matches = {
-            key: self._get_match_method(key, mode)(target)
-            for key in ('variable', 'constant')
-        }
-        if not any(matches.values()):
-            return
-        if all(matches.values()):
-            same = matches['variable'][0] == matches['constant'][0]
-            key = 'constant' if same else 'variable'
-            build_method = self._get_build_method(key)
-            return build_method(matches[key])
-        for key, match in matches.items():
-            if match:
-                return self._get_build_method(key)(match)
+        variable = self._get_match_method('variable', mode)(target)
+        if variable and (
+            variable['coefficient'] is None
+            or variable['base'][0] not in 'eE'
+        ): return self._build_variable(variable)
+        constant = self._get_match_method('constant', mode)(target)
+        if variable and constant:
+            if variable[0] == constant[0]:
+                return self._build_constant(constant)
+            return self._build_variable(variable)
+        if variable:
+            return self._build_variable(variable)
+        if constant:
+            return self._build_constant(constant)
 
     def _get_match_method(
         self,
@@ -435,16 +496,17 @@ class OperandFactory(_part.Factory):
         """Look up the appropriate matching method for `pattern` and `mode`."""
         return getattr(self.patterns[pattern], mode)
 
-    def _get_build_method(
-        self,
-        pattern: str,
-    ) -> typing.Callable[[re.Match], _part.Match[Operand]]:
-        """Look up the appropriate building method for `pattern`."""
-        return getattr(self, f'_build_{pattern}')
-
     def _build_variable(self, match: re.Match):
         """Build a variable term from a match object."""
-        standard = self.standardize(**match.groupdict(), fill=True)
+        coefficient, base, exponent = match.group(
+            'coefficient', 'base', 'exponent'
+        )
+        standard = self.standardize(
+            coefficient=coefficient,
+            base=base,
+            exponent=exponent,
+            fill=True,
+        )
         return _part.Match(
             result=term_factory(**standard),
             context=match,
@@ -452,7 +514,12 @@ class OperandFactory(_part.Factory):
 
     def _build_constant(self, match: re.Match):
         """Build a constant term from a match object."""
-        standard = self.standardize(**match.groupdict(), fill=True)
+        coefficient, exponent = match.group('coefficient', 'exponent')
+        standard = self.standardize(
+            coefficient=coefficient,
+            exponent=exponent,
+            fill=True,
+        )
         coefficient = standard['coefficient'] ** standard['exponent']
         return _part.Match(
             result=term_factory(coefficient=float(coefficient)),
@@ -467,20 +534,24 @@ class OperandFactory(_part.Factory):
     ) -> typing.Optional[_part.Match[Operand]]:
         """Attempt to match a complex operand at the start of `string`."""
         target = string[start:]
+        if self._opening_ch not in target:
+            return
         bounds = self.find_bounds(target)
         if not bounds:
             return
         i0, end = bounds
         result = {'base': target[i0+1:end-1]}
-        if match := self._match_simplex(target[:i0], mode='fullmatch'):
-            result['coefficient'] = match.result.coefficient
-            i0 = 0
-        if mode == 'match' and i0 != 0:
-            return
+        if i0 > 0:
+            # When matching at the start of `target`, anything before the
+            # opening separator must be a coefficient.
+            if match := self._match_simplex(target[:i0], mode='fullmatch'):
+                result['coefficient'] = match.result.coefficient
+            elif mode in {'match', 'fullmatch'}:
+                return
         if exp := self.patterns['exponent'].match(target[end:]):
             result['exponent'] = exp[0]
             end += exp.end()
-        if mode == 'fullmatch' and (i0, end) != (0, len(target)):
+        if mode == 'fullmatch' and end != len(target):
             return
         standard = self.standardize(**result, fill=True)
         return _part.Match(
@@ -577,16 +648,15 @@ class OperandFactory(_part.Factory):
             'base': {'callable': self._standard_base},
             'exponent': {'callable': self._standard_exponent},
         }
-        default = self.fill_defaults(**dict.fromkeys(full.keys()))
-        updatable = full.copy() if fill else {k: full[k] for k in given}
+        updatable = full if fill else {k: full[k] for k in given}
         return {
-            key: attr['callable'](given.get(key) or default[key])
+            key: attr['callable'](given.get(key) or self._defaults[key])
             for key, attr in updatable.items()
         }
 
     def _standard_coefficient(self, v):
         """Convert input to a standard coefficient."""
-        return fractions.Fraction(v or 1)
+        return _as_fraction(v)
 
     def _standard_base(self, v):
         """Convert input to a standard base."""
@@ -596,7 +666,7 @@ class OperandFactory(_part.Factory):
         """Convert input to a standard exponent."""
         if isinstance(v, str):
             v = self.patterns['raising'].sub('', v)
-        return fractions.Fraction(v or 1)
+        return _as_fraction(v)
 
     def fill_defaults(self, **given):
         """Return the default value for any explicitly null arguments.
@@ -606,29 +676,16 @@ class OperandFactory(_part.Factory):
         will pass all other values through unaltered and will not fill in
         default values corresponding to other keys.
         """
-        defaults = {
-            'coefficient': 1,
-            'base': '1',
-            'exponent': 1,
-        }
-        given.update(
-            {
-                key: defaults[key]
-                for key, value in given.items()
-                if key in defaults and not value
-            }
-        )
+        for key, default in self._defaults.items():
+            if key in given and not given[key]:
+                given[key] = default
         return given
 
     def strip_separators(self, string: str):
         """Remove one opening and one closing separator."""
-        opened = self.patterns['opening'].match(string[0])
-        closed = self.patterns['closing'].match(string[-1])
-        if not (opened and closed):
-            return string
-        string = self.patterns['opening'].sub('', string, count=1)
-        string = self.patterns['closing'].sub('', string[::-1], count=1)
-        return string[::-1]
+        if string[:1] == self._opening_ch and string[-1:] == self._closing_ch:
+            return string[1:-1]
+        return string
 
 
 class Term(Operand):
@@ -642,29 +699,27 @@ class Term(Operand):
     combinations.
     """
 
-    # NOTE: Currently redundant with `OperandFactory`.
-
-    rational = r""" # Modeled after `fractions._RATIONAL_FORMAT`
-        [-+]?                 # an optional sign, ...
-        (?=\d|\.\d)           # ... only if followed by <digit> or .<digit>
-        \d*                   # and a possibly empty numerator
-        (?:                   # followed by ...
-            (?:/\d+?)         # ... an optional denominator
-        |                     # OR
-            (?:\.\d*)?        # ... an optional fractional part,
-            (?:[eE][-+]?\d+)? #     and an optional exponent
-        )
-    """
-    base = r"""
-        [a-zA-Z#_]+ # one or more accepted non-digit character(s)
-        \d*         # followed by optional digits
-    """
-    _base_re = re.compile(fr'({rational}|{base})', re.VERBOSE)
+    _base_re = _BASE_RE
+
+    is_term = True
+
+    __slots__ = ('_hash',)
+
+    def __init__(
+        self,
+        coefficient: numbers.Real=None,
+        base: str=None,
+        exponent: numbers.Real=None,
+    ) -> None:
+        super().__init__(coefficient, base, exponent)
+        self._hash = None
 
     @classmethod
     def base_is_valid(cls, base):
         """True if `base` can initialize a symbolic term."""
-        return bool(cls._base_re.fullmatch(str(base)))
+        if isinstance(base, str):
+            return cls._base_re.fullmatch(base) is not None
+        return cls._base_re.fullmatch(str(base)) is not None
 
     def __call__(self, value: numbers.Real):
         """Evaluate a variable term at this value.
@@ -710,9 +765,11 @@ class Term(Operand):
         
         - `'tex'`: format the term for TeX-like display.
         """
-        coefficient = self._format_coefficient()
         if self.base == '1':
-            return f"{coefficient}"
+            return f"{self._format_coefficient()}"
+        if not style and self.coefficient == 1 and self.exponent == 1:
+            return self.base
+        coefficient = self._format_coefficient()
         fmt = style or ''
         exponent = self._format_exponent(fmt)
         if 'tex' in fmt.lower():
@@ -770,7 +827,7 @@ class Term(Operand):
         if isinstance(other, numbers.Real):
             return float(self) == float(other)
         if isinstance(other, str):
-            term = OperandFactory().create(other)
+            term = _FACTORY.create(other)
             return super().__eq__(term)
         return super().__eq__(other)
 
@@ -779,7 +836,12 @@ class Term(Operand):
         # to explicitly define `Term.__hash__`. See
         # https://docs.python.org/3/reference/datamodel.html#object.__hash__ for
         # an explanation.
-        return hash(self.attrs)
+        #
+        # Terms are immutable after initialization, so we compute the hash
+        # once and store it for subsequent calls.
+        if self._hash is None:
+            self._hash = hash(self.attrs)
+        return self._hash
 
 
 @typing.overload
@@ -851,8 +913,33 @@ def _validate_term_base(base):
         ) from None
 
 
+@functools.lru_cache(maxsize=None)
+def _shared_factory(opening: str, closing: str, raising: str):
+    """Get the shared operand factory for the given tokens."""
+    return OperandFactory(opening, closing, raising)
+
+
+@functools.lru_cache(maxsize=4096)
+def _create_shared(
+    tokens: typing.Tuple[str, str, str],
+    args: tuple,
+    strict: bool,
+) -> typing.Optional[Operand]:
+    """Create an operand with the shared factory for `tokens`.
+
+    This function caches results on plain hashable input, rather than on factory
+    instances, so that the cache does not keep individual factories alive.
+    """
+    return _shared_factory(*tokens)._create(args, strict)
+
+
+_FACTORY = _shared_factory(*_DEFAULT_TOKENS)
+"""A shared operand factory with the default tokens."""
+
+
 def asterms(these: typing.Iterable[str]):
     """Convert strings to terms, if possible."""
-    return [OperandFactory().create(this) for this in these]
+    create = _FACTORY.create
+    return [create(this) for this in these]
 
 
@@ -1,4 +1,5 @@
 import re
+import types
 
 from . import _part
 
@@ -6,6 +7,8 @@ from . import _part
 class Operator(_part.Part):
     """An operator in a symbolic expression."""
 
+    __slots__ = ('operation',)
+
     def __init__(self, operation: str) -> None:
         self.operation = operation
 
@@ -19,6 +22,8 @@ class Operator(_part.Part):
 
     def __eq__(self, other) -> bool:
         """True if two operators represent the same operation."""
+        if self is other:
+            return True
         if isinstance(other, Operator):
             return other.operation == self.operation
         if isinstance(other, str):
@@ -26,9 +31,18 @@ class Operator(_part.Part):
         return NotImplemented
 
 
+OPERATORS = {
+    name: Operator(name)
+    for name in ('multiply', 'divide', 'sqrt', 'identity')
+}
+"""Shared instances of the known operators."""
+
+
 class OperatorFactory(_part.Factory):
     """A factory that produces symbolic operators."""
 
+    __slots__ = ('patterns', '_pattern', '_initials')
+
     def __init__(
         self,
         multiply: str='*',
@@ -36,24 +50,35 @@ class OperatorFactory(_part.Factory):
     ) -> None:
         mul = fr'\{multiply}'
         div = fr'\{divide}'
-        self.patterns = {
-            'multiply': re.compile(
-                fr'(?<!{div})(\s*{mul}\s*)(?!{div})'
-            ),
-            'divide': re.compile(
-                fr'(?<!{mul})(\s*{div}\s*)(?!{mul})'
-            ),
-            'sqrt': re.compile(r'\s*sqrt\s*')
+        sources = {
+            'multiply': fr'(?<!{div})(\s*{mul}\s*)(?!{div})',
+            'divide': fr'(?<!{mul})(\s*{div}\s*)(?!{mul})',
+            'sqrt': r'\s*sqrt\s*',
         }
+        self.patterns = types.MappingProxyType(
+            {key: re.compile(source) for key, source in sources.items()}
+        )
         """Compiled regular expressions for symbolic operators."""
+        # The look-behind assertions in `patterns` always succeed at the start
+        # of a string, which is the only place that `parse` looks for an
+        # operator, so the combined pattern omits them.
+        self._pattern = re.compile(
+            fr'(?P<multiply>\s*{mul}\s*(?!{div}))'
+            fr'|(?P<divide>\s*{div}\s*(?!{mul}))'
+            r'|(?P<sqrt>\s*sqrt\s*)'
+        )
+        """A single pattern that matches any operator, by name."""
+        self._initials = frozenset((multiply[0], divide[0], 's'))
+        """The characters that may begin an operator, after any whitespace."""
 
     def parse(self, string: str):
         """Extract an operator at the start of `string`, possible."""
-        for key in self.patterns:
-            if match := self.patterns[key].match(string):
-                return _part.Match(
-                    result=Operator(key),
-                    context=match,
-                )
-
-
+        # A string that begins with an operand can't begin with an operator,
+        # so there is no need to run the regular expression.
+        if string.lstrip()[:1] not in self._initials:
+            return
+        if match := self._pattern.match(string):
+            return _part.Match(
+                result=OPERATORS[match.lastgroup],
+                context=match,
+            )
@@ -1,3 +1,5 @@
+import functools
+import re
 import typing
 
 from . import _operand
@@ -38,42 +40,91 @@ class ParsingValueError(ValueError):
     pass
 
 
-class Iteration:
-    """An object that keeps track of parsing attributes."""
+_MULTIPLY = _operator.OPERATORS['multiply']
+_DIVIDE = _operator.OPERATORS['divide']
+_SQRT = _operator.OPERATORS['sqrt']
+_IDENTITY = _operator.OPERATORS['identity']
 
-    __slots__ = ('string', 'operator', 'operand')
 
-    def __init__(
-        self,
-        string: str,
-        operator: _operator.Operator=None,
-        operand: _operand.Operand=None,
-    ) -> None:
-        self.string = string
-        self.operator = operator
-        self.operand = operand
+_HALF: typing.Final = 0.5
+_NEG_ONE: typing.Final = -1
+
+_EFFECTS = {
+    'multiply': lambda operand: operand,
+    'identity': lambda operand: operand,
+    'divide': lambda operand: operand ** _NEG_ONE,
+    'sqrt': lambda operand: operand ** _HALF,
+}
+"""The effect of each known operation on the subsequent operand."""
+
+
+_SIMPLE_BASE = fr'(?!sqrt){_operand._BASE}'
+"""Pattern for a base that the operator factory will not read as `sqrt`."""
+
+
+@functools.lru_cache(maxsize=None)
+def _simple_pattern(tokens: typing.Tuple[str, ...], divide: str):
+    """Compile the pattern for strings that need no general parsing.
+
+    The pattern matches a single base or a ratio of two bases, with optional
+    surrounding whitespace. This function returns `None` if any of `tokens`
+    could appear in, or between, bases.
+    """
+    if re.search(r'[\w#\s]', ''.join(tokens)):
+        return
+    return re.compile(
+        fr'\s*(?P<numerator>{_SIMPLE_BASE})\s*'
+        fr'(?:{re.escape(divide)}\s*(?P<denominator>{_SIMPLE_BASE})\s*)?'
+    )
 
-    @property
-    def _attrs(self):
-        """Internal mapping of current attribute values."""
-        return {name: getattr(self, name) for name in self.__slots__}
 
-    def copy(self):
-        """Make a copy of this instance."""
-        return type(self)(**self._attrs)
+def _operand_factory(opening: str, closing: str, raising: str):
+    """Get the shared operand factory for the given tokens."""
+    return _operand._shared_factory(opening, closing, raising)
 
-    def __str__(self):
-        """A simplified representation of this object."""
-        return ', '.join(f"{k}={v!r}" for k, v in self._attrs.items())
 
-    def __repr__(self):
-        """An unambiguous representation of this object."""
-        return f"{self.__class__.__qualname__}({self})"
+@functools.lru_cache(maxsize=None)
+def _operator_factory(multiply: str, divide: str):
+    """Get the shared operator factory for the given tokens."""
+    return _operator.OperatorFactory(multiply, divide)
+
+
+@functools.lru_cache(maxsize=None)
+def parser_factory(**options):
+    """Get the shared parser for the given options.
+
+    See `~Parser` for a description of available options. Sharing parsers lets
+    repeated expressions reuse cached parsing results.
+    """
+    return Parser(**options)
+
+
+@functools.lru_cache(maxsize=2048)
+def _parse_shared(
+    string: str,
+    options: typing.Tuple[typing.Tuple[str, str], ...],
+) -> typing.Tuple[_operand.Term, ...]:
+    """Resolve `string` with the shared parser for `options`.
+
+    This function caches results on plain hashable input, rather than on parser
+    instances, so that the cache does not keep individual parsers alive.
+    """
+    return parser_factory(**dict(options))._resolve(string)
 
 
 class Parser:
     """A tool for parsing symbolic expressions."""
 
+    __slots__ = (
+        'operands',
+        'operators',
+        'parsers',
+        'tokens',
+        '_operator_order',
+        '_options',
+        '_simple',
+    )
+
     def __init__(
         self,
         multiply: str='*',
@@ -109,8 +160,8 @@ class Parser:
             independent of one another. If set to `'error'`, the parser will
             raise an exception based on the type of violation.
         """
-        self.operands = _operand.OperandFactory(opening, closing, raising)
-        self.operators = _operator.OperatorFactory(multiply, divide)
+        self.operands = _operand_factory(opening, closing, raising)
+        self.operators = _operator_factory(multiply, divide)
         self.parsers = (self.operands, self.operators)
         self.tokens = {
             'multiply': multiply,
@@ -120,22 +171,69 @@ class Parser:
             'raising': raising,
         }
         self._operator_order = operator_order
+        self._options = (
+            *self.tokens.items(),
+            ('operator_order', operator_order),
+        )
+        self._simple = _simple_pattern(tuple(self.tokens.values()), divide)
 
     def parse(self, string: str):
         """Resolve the given string into individual terms."""
+        if type(self) is Parser:
+            return list(_parse_shared(string, self._options))
+        return list(self._resolve(string))
+
+    def _resolve(self, string: str):
+        """Resolve `string` into a tuple of terms."""
+        if self._simple and (match := self._simple.fullmatch(string)):
+            return self._resolve_simple(*match.group('numerator', 'denominator'))
         operand = _operand.Operand(base=string)
-        return self._resolve_operations(operand)
+        return tuple(self._resolve_operations(operand))
+
+    def _resolve_simple(self, numerator: str, denominator: str=None):
+        """Create terms for a single base or a ratio of two bases.
+
+        The result is identical to what `_resolve_operations` would produce for
+        the equivalent string.
+        """
+        if denominator:
+            return (
+                _operand.term_factory(base=numerator),
+                _operand.term_factory(base=denominator, exponent=-1),
+            )
+        return (_operand.term_factory(base=numerator),)
 
     def _resolve_operations(
         self,
         current: _operand.Operand,
     ) -> typing.List[_operand.Term]:
-        """Separate a symbolic group into operators and operands."""
-        operands = self._parse_operand(current)
-        return [
-            t for operand in operands
-            for t in self._update_terms(operand)
-        ] + [_operand.term_factory(coefficient=current.coefficient)]
+        """Separate a symbolic group into operators and operands.
+
+        This method resolves nested groups with an explicit stack rather than
+        by recursion. Each entry pairs an operand with a flag that indicates
+        whether it requires further parsing. The stack receives each group's
+        coefficient before its operands, and receives operands in reverse, so
+        that the resolved terms of a group precede its coefficient and appear
+        in their original order. A unit coefficient has no effect on the
+        product of terms, so this method omits it.
+        """
+        # TODO: Consider extracting all coefficients, at least as separate
+        # constant terms.
+        term_factory = _operand.term_factory
+        terms = []
+        stack = [(current, True)]
+        while stack:
+            operand, nested = stack.pop()
+            if not nested:
+                terms.append(operand)
+                continue
+            if (c := operand.coefficient) != 1:
+                stack.append((term_factory(coefficient=c), False))
+            stack.extend(
+                (new, not new.is_term)
+                for new in reversed(self._parse_operand(operand))
+            )
+        return terms
 
     def _parse_operand(
         self,
@@ -147,52 +245,42 @@ class Parser:
         while preserving nested groups in the latter. Calling code may then pass
         those nested groups back in for further parsing.
         """
+        parse_operator = self.operators.parse
+        parse_operand = self.operands.parse
+        compute_operand = self._compute_operand
+        exponent = initial.exponent
         operands = []
-        current = Iteration(initial.base)
-        previous = current.copy()
-        while current.string:
-            current = self._get_operator(initial, current, previous)
-            current = self._get_operand(initial, current)
-            if new := self._compute_operand(current):
+        string = initial.base
+        previous = None
+        while string:
+            operator = None
+            if parsed := parse_operator(string):
+                operator = parsed.result
+                if exception := self._operator_error(operator, previous):
+                    raise exception(initial)
+                string = parsed.remainder
+            operand = None
+            if parsed := parse_operand(string):
+                operand = parsed.result ** exponent
+                string = parsed.remainder
+            if new := compute_operand(operator, operand):
                 operands.append(new)
-            previous = current.copy()
-            current = Iteration(previous.string)
+            previous = operator
         return operands
 
-    def _get_operator(
-        self,
-        initial: _operand.Operand,
-        current: Iteration,
-        previous: Iteration,
-    ) -> Iteration:
-        """Attempt to parse an operator from the current string."""
-        if parsed := self.operators.parse(current.string):
-            current.operator = parsed.result
-            if exception := self._operator_error(
-                    current.operator,
-                    previous.operator,
-                ): raise exception(initial)
-            current.string = parsed.remainder
-        return current
-
-    def _get_operand(
+    def _compute_operand(
         self,
-        initial: _operand.Operand,
-        current: Iteration,
-    ) -> Iteration:
-        """Attempt to parse an operand from the current string."""
-        if parsed := self.operands.parse(current.string):
-            current.operand = parsed.result ** initial.exponent
-            current.string = parsed.remainder
-        return current
-
-    def _compute_operand(self, current: Iteration):
-        """Create a new operand from the current iteration."""
-        if current.operand and current.operator:
-            return self._evaluate(current.operator, current.operand)
-        if current.operand:
-            return current.operand
-        if current.operator:
+        operator: typing.Optional[_operator.Operator],
+        operand: typing.Optional[_operand.Operand],
+    ) -> _operand.Operand:
+        """Create a new operand from the current operator and operand."""
+        has_operand = operand is not None
+        has_operator = operator is not None
+        if has_operand and has_operator:
+            return self._evaluate(operator, operand)
+        if has_operand:
+            return operand
+        if has_operator:
             raise ParsingValueError("Operator without operand")
         raise ParsingValueError("Failed to parse string")
 
@@ -221,10 +309,10 @@ class Parser:
         """
         if self._operator_order == 'ignore':
             return
-        if previous == 'divide':
-            if current == 'divide':
+        if previous is _DIVIDE:
+            if current is _DIVIDE:
                 return RatioError
-            if current == 'multiply':
+            if current is _MULTIPLY:
                 return ProductError
 
     def _evaluate(
@@ -233,20 +321,6 @@ class Parser:
         operand: _operand.Operand,
     ) -> _operand.Operand:
         """Compute the effect of `operator` on `operand`."""
-        if operator in {'multiply', 'identity'}:
-            return operand
-        if operator == 'divide':
-            return operand ** -1
-        if operator == 'sqrt':
-            return operand ** 0.5
+        if effect := _EFFECTS.get(operator.operation):
+            return effect(operand)
         raise ValueError(f"Unrecognized operator {operator!r}")
-
-    def _update_terms(self, operand: _operand.Operand):
-        """Store a new term or initiate further parsing."""
-        # TODO: Consider extracting all coefficients, at least as separate
-        # constant terms.
-        if isinstance(operand, _operand.Term):
-            return [operand]
-        return self._resolve_operations(operand)
-
-
@@ -1,8 +1,13 @@
 import abc
+import collections.abc
 import re
 import typing
 
 
+_REMatch = re.Match
+_Mapping = collections.abc.Mapping
+
+
 class Part(abc.ABC):
     """Base class for parts of a symbolic expression."""
 
@@ -15,19 +20,23 @@ _PartType = typing.TypeVar('_PartType', bound=Part)
 class Match(typing.Generic[_PartType]):
     """An object that represents the result of a RE pattern match."""
 
+    __slots__ = ('result', 'start', 'end', 'string', '_remainder')
+
     def __new__(cls, result, context):
-        """Check argument types."""
-        if not isinstance(result, Part):
-            raise TypeError(
-                f"Result must be a Part"
-                f", not {type(result)}"
-            ) from None
-        if not isinstance(context, (re.Match, typing.Mapping)):
-            raise TypeError(
-                f"Context may be a Match object or a Mapping"
-                f", not {type(context)}"
-            )
-        return super().__new__(cls)
+        """Check argument types, unless running with optimizations (`-O`)."""
+        if __debug__:
+            if not isinstance(result, Part):
+                raise TypeError(
+                    f"Result must be a Part"
+                    f", not {type(result)}"
+                ) from None
+            is_match = type(context) is _REMatch
+            if not (is_match or isinstance(context, _Mapping)):
+                raise TypeError(
+                    f"Context may be a Match object or a Mapping"
+                    f", not {type(context)}"
+                )
+        return object.__new__(cls)
 
     def __init__(
         self,
@@ -36,51 +45,31 @@ class Match(typing.Generic[_PartType]):
     ) -> None:
         self.result = result
         """The result of the match attempt."""
-        self._context = self._set_context(context)
-
-    def _set_context(self, user: typing.Any) -> dict:
-        """Normalize the instance context from user input."""
-        if isinstance(user, re.Match):
-            return self._set_from_match(user)
-        if isinstance(user, typing.Mapping):
-            return self._set_from_mapping(user)
-
-    def _set_from_match(self, match: re.Match):
-        """Set the instance context from a match object."""
-        return {
-            'start': match.start(),
-            'end': match.end(),
-            'string': match.string,
-        }
-
-    def _set_from_mapping(self, mapping: typing.Mapping):
-        """Set the instance context from a mapping."""
-        attrs = (
-            'start',
-            'end',
-            'string',
-        )
-        return {k: mapping.get(k) for k in attrs}
+        if type(context) is _REMatch:
+            self.start = context.start()
+            self.end = context.end()
+            self.string = context.string
+        else:
+            self.start = context.get('start')
+            self.end = context.get('end')
+            self.string = context.get('string')
+        self._remainder = None
 
-    @property
-    def start(self) -> int:
-        """The starting index in `string` of the match."""
-        return self._context['start']
+    start: int
+    """The starting index in `string` of the match."""
 
-    @property
-    def end(self) -> int:
-        """The ending index in `string` of the match."""
-        return self._context['end']
+    end: int
+    """The ending index in `string` of the match."""
 
-    @property
-    def string(self) -> str:
-        """The target string."""
-        return self._context['string']
+    string: str
+    """The target string."""
 
     @property
     def remainder(self) -> str:
         """The unparsed portion of `string` after `end`."""
-        return self.string[self.end:]
+        if self._remainder is None:
+            self._remainder = self.string[self.end:]
+        return self._remainder
 
     def __bool__(self) -> bool:
         """Always true, like `re.Match`."""
@@ -88,16 +77,19 @@ class Match(typing.Generic[_PartType]):
 
     def __str__(self) -> str:
         """A simplified representation of this object."""
-        attrs = {
-            'result': 'result',
-            'context': '_context',
+        context = {
+            'start': self.start,
+            'end': self.end,
+            'string': self.string,
         }
-        return ', '.join(f"{k}: {getattr(self, v)}" for k, v in attrs.items())
+        return f"result: {self.result}, context: {context}"
 
 
 class Factory(typing.Protocol):
     """Abstract protocol class for symbolic factories."""
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def parse(self) -> Match: ...
 
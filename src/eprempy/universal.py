@@ -3,6 +3,8 @@ Values and metadata of universal physical constants.
 """
 
 import collections.abc
+import operator
+import types
 import typing
 
 import numpy
@@ -13,174 +15,270 @@ from . import physical
 from . import real
 
 
-_constants = {
-    'pi': {
-        'info': "The ratio of a circle's circumference to its diameter.",
-        'all': numpy.pi,
-        'quantity': 'number',
-    },
-    'k': {
-        'info': "Boltzmann's constant.",
-        'mks': {'unit': 'J / K', 'value': 1.3807e-23},
-        'cgs': {'unit': 'erg / K', 'value': 1.3807e-16},
-        'quantity': 'energy / temperature'
-    },
-    'e': {
-        'info': "Elementary charge.",
-        'mks': {'unit': 'C', 'value': 1.6022e-19},
-        'cgs': {'unit': 'statC', 'value': 4.8032e-10},
-        'quantity': 'charge',
-    },
-    'me': {
-        'info': "Electron mass.",
-        'mks': {'unit': 'kg', 'value': 9.1094e-31},
-        'cgs': {'unit': 'g', 'value': 9.1094e-28},
-        'quantity': 'mass',
-    },
-    'mp': {
-        'info': "Proton mass.",
-        'mks': {'unit': 'kg', 'value': 1.6726e-27},
-        'cgs': {'unit': 'g', 'value': 1.6726e-24},
-        'quantity': 'mass',
-    },
-    'G': {
-        'info': "Gravitational constant.",
-        'mks': {'unit': 'm^3 / (s^2 * kg)', 'value': 6.6726e-11},
-        'cgs': {'unit': 'dyn * cm^2 / g^2', 'value': 6.6726e-8},
-        'quantity': 'force * area / mass^2',
-    },
-    'g': {
-        'info': "Gravitational acceleration.",
-        'mks': {'unit': 'm / s^2', 'value': 9.8067},
-        'cgs': {'unit': 'cm / s^2', 'value': 9.8067e2},
-        'quantity': 'acceleration',
-    },
-    'h': {
-        'info': "Planck's constant.",
-        'mks': {'unit': 'J * s', 'value': 6.6261e-34},
-        'cgs': {'unit': 'erg * s', 'value': 6.6261e-27},
-        'quantity': 'energy * time',
-    },
-    'c': {
-        'info': "Speed of light in a vacuum.",
-        'mks': {'unit': 'm / s', 'value': 2.99792458e8},
-        'cgs': {'unit': 'cm / s', 'value': 2.99792458e10},
-        'quantity': 'speed',
-    },
-    'epsilon0': {
-        'info': "Permittivity of free space.",
-        'mks': {'unit': 'F / m', 'value': 8.8542e-12},
-        'cgs': {'unit': '1', 'value': 1.0},
-        'quantity': 'permittivity',
-    },
-    'mu0': {
-        'info': "Permeability of free space.",
-        'mks': {'unit': 'H / m', 'value': 4*numpy.pi * 1e-7},
-        'cgs': {'unit': '1', 'value': 1.0},
-        'quantity': 'permeability',
-    },
-    'Rinfinity': {
-        'info': "Rydberg constant.",
-        'mks': {'unit': '1 / m', 'value': 1.0974e7},
-        'cgs': {'unit': '1 / cm', 'value': 1.0974e5},
-        'quantity': '1 / length',
-    },
-    'a0': {
-        'info': "Bohr radius.",
-        'mks': {'unit': 'm', 'value': 5.2918e-11},
-        'cgs': {'unit': 'cm', 'value': 5.2918e-9},
-        'quantity': 'length',
-    },
-    're': {
-        'info': "Classical electron radius.",
-        'mks': {'unit': 'm', 'value': 2.8179e-15},
-        'cgs': {'unit': 'cm', 'value': 2.8179e-13},
-        'quantity': 'length',
-    },
-    'alpha': {
-        'info': "Fine structure constant.",
-        'mks': {'unit': '1', 'value': 7.2974e-3},
-        'cgs': {'unit': '1', 'value': 7.2974e-3},
-        'quantity': 'number',
-    },
-    'c1': {
-        'info': "First radiation constant.",
-        'mks': {'unit': 'W * m^2', 'value': 3.7418e-16},
-        'cgs': {'unit': 'erg * cm^2 / s', 'value': 3.7418e-16},
-        'quantity': 'power * area',
-    },
-    'c2': {
-        'info': "Second radiation constant.",
-        'mks': {'unit': 'm * K', 'value': 1.4388e-2},
-        'cgs': {'unit': 'cm * K', 'value': 1.4388},
-        'quantity': 'length * temperature',
-    },
-    'sigma': {
-        'info': "Stefan-Boltzmann constant.",
-        'mks': {'unit': 'W / (m^2 * K^4)', 'value': 5.6705e-8},
-        'cgs': {'unit': '(erg / s) / (cm^2 * K^4)', 'value': 5.6705e-5},
-        'quantity': 'power / (area * temperature^4)',
-    },
-    'eV': {
-        'info': "Energy associated with 1 eV.",
-        'mks': {'unit': 'J', 'value': 1.6022e-19},
-        'cgs': {'unit': 'erg', 'value': 1.6022e-12},
-        'quantity': 'energy',
-    },
-    'amu': {
-        'info': "Atomic mass unit.",
-        'mks': {'unit': 'kg', 'value': 1.6605e-27},
-        'cgs': {'unit': 'g', 'value': 1.6605e-24},
-        'quantity': 'mass',
-    },
-    'au': {
-        'info': "Astronomical unit.",
-        'mks': {'unit': 'm', 'value': 1.495978707e11},
-        'cgs': {'unit': 'cm', 'value': 1.495978707e13},
-        'quantity': 'length',
-    },
+class _Definition(typing.NamedTuple):
+    """The values, units, and metadata of a universal constant."""
+
+    mks_value: float
+    mks_unit: str
+    cgs_value: float
+    cgs_unit: str
+    quantity: str
+    info: str
+
+
+_DEFINITIONS = {
+    'pi': _Definition(
+        mks_value=numpy.pi,
+        mks_unit='1',
+        cgs_value=numpy.pi,
+        cgs_unit='1',
+        quantity='number',
+        info="The ratio of a circle's circumference to its diameter.",
+    ),
+    'k': _Definition(
+        mks_value=1.3807e-23,
+        mks_unit='J / K',
+        cgs_value=1.3807e-16,
+        cgs_unit='erg / K',
+        quantity='energy / temperature',
+        info="Boltzmann's constant.",
+    ),
+    'e': _Definition(
+        mks_value=1.6022e-19,
+        mks_unit='C',
+        cgs_value=4.8032e-10,
+        cgs_unit='statC',
+        quantity='charge',
+        info="Elementary charge.",
+    ),
+    'me': _Definition(
+        mks_value=9.1094e-31,
+        mks_unit='kg',
+        cgs_value=9.1094e-28,
+        cgs_unit='g',
+        quantity='mass',
+        info="Electron mass.",
+    ),
+    'mp': _Definition(
+        mks_value=1.6726e-27,
+        mks_unit='kg',
+        cgs_value=1.6726e-24,
+        cgs_unit='g',
+        quantity='mass',
+        info="Proton mass.",
+    ),
+    'G': _Definition(
+        mks_value=6.6726e-11,
+        mks_unit='m^3 / (s^2 * kg)',
+        cgs_value=6.6726e-8,
+        cgs_unit='dyn * cm^2 / g^2',
+        quantity='force * area / mass^2',
+        info="Gravitational constant.",
+    ),
+    'g': _Definition(
+        mks_value=9.8067,
+        mks_unit='m / s^2',
+        cgs_value=9.8067e2,
+        cgs_unit='cm / s^2',
+        quantity='acceleration',
+        info="Gravitational acceleration.",
+    ),
+    'h': _Definition(
+        mks_value=6.6261e-34,
+        mks_unit='J * s',
+        cgs_value=6.6261e-27,
+        cgs_unit='erg * s',
+        quantity='energy * time',
+        info="Planck's constant.",
+    ),
+    'c': _Definition(
+        mks_value=2.99792458e8,
+        mks_unit='m / s',
+        cgs_value=2.99792458e10,
+        cgs_unit='cm / s',
+        quantity='speed',
+        info="Speed of light in a vacuum.",
+    ),
+    'epsilon0': _Definition(
+        mks_value=8.8542e-12,
+        mks_unit='F / m',
+        cgs_value=1.0,
+        cgs_unit='1',
+        quantity='permittivity',
+        info="Permittivity of free space.",
+    ),
+    'mu0': _Definition(
+        mks_value=4*numpy.pi * 1e-7,
+        mks_unit='H / m',
+        cgs_value=1.0,
+        cgs_unit='1',
+        quantity='permeability',
+        info="Permeability of free space.",
+    ),
+    'Rinfinity': _Definition(
+        mks_value=1.0974e7,
+        mks_unit='1 / m',
+        cgs_value=1.0974e5,
+        cgs_unit='1 / cm',
+        quantity='1 / length',
+        info="Rydberg constant.",
+    ),
+    'a0': _Definition(
+        mks_value=5.2918e-11,
+        mks_unit='m',
+        cgs_value=5.2918e-9,
+        cgs_unit='cm',
+        quantity='length',
+        info="Bohr radius.",
+    ),
+    're': _Definition(
+        mks_value=2.8179e-15,
+        mks_unit='m',
+        cgs_value=2.8179e-13,
+        cgs_unit='cm',
+        quantity='length',
+        info="Classical electron radius.",
+    ),
+    'alpha': _Definition(
+        mks_value=7.2974e-3,
+        mks_unit='1',
+        cgs_value=7.2974e-3,
+        cgs_unit='1',
+        quantity='number',
+        info="Fine structure constant.",
+    ),
+    'c1': _Definition(
+        mks_value=3.7418e-16,
+        mks_unit='W * m^2',
+        cgs_value=3.7418e-16,
+        cgs_unit='erg * cm^2 / s',
+        quantity='power * area',
+        info="First radiation constant.",
+    ),
+    'c2': _Definition(
+        mks_value=1.4388e-2,
+        mks_unit='m * K',
+        cgs_value=1.4388,
+        cgs_unit='cm * K',
+        quantity='length * temperature',
+        info="Second radiation constant.",
+    ),
+    'sigma': _Definition(
+        mks_value=5.6705e-8,
+        mks_unit='W / (m^2 * K^4)',
+        cgs_value=5.6705e-5,
+        cgs_unit='(erg / s) / (cm^2 * K^4)',
+        quantity='power / (area * temperature^4)',
+        info="Stefan-Boltzmann constant.",
+    ),
+    'eV': _Definition(
+        mks_value=1.6022e-19,
+        mks_unit='J',
+        cgs_value=1.6022e-12,
+        cgs_unit='erg',
+        quantity='energy',
+        info="Energy associated with 1 eV.",
+    ),
+    'amu': _Definition(
+        mks_value=1.6605e-27,
+        mks_unit='kg',
+        cgs_value=1.6605e-24,
+        cgs_unit='g',
+        quantity='mass',
+        info="Atomic mass unit.",
+    ),
+    'au': _Definition(
+        mks_value=1.495978707e11,
+        mks_unit='m',
+        cgs_value=1.495978707e13,
+        cgs_unit='cm',
+        quantity='length',
+        info="Astronomical unit.",
+    ),
+    'H+': _Definition(
+        mks_value=13.6 * 1.6022e-19,
+        mks_unit='J',
+        cgs_value=13.6 * 1.6022e-12,
+        cgs_unit='erg',
+        quantity='energy',
+        info="First ionization energy of hydrogen.",
+    ),
+    'MeV': _Definition(
+        mks_value=1e6 * 1.6022e-19,
+        mks_unit='J',
+        cgs_value=1e6 * 1.6022e-12,
+        cgs_unit='erg',
+        quantity='energy',
+        info="Energy associated with 1 MeV.",
+    ),
 }
-_constants['H+'] = {
-    'info': "First ionization energy of hydrogen.",
-    **{
-        k: {
-            'unit': _constants['eV'][k]['unit'],
-            'value': 13.6 * _constants['eV'][k]['value'],
+"""The definition of each universal constant, by name."""
+
+
+def _freeze(definition: _Definition):
+    """Create a read-only, nested view of a constant definition."""
+    return types.MappingProxyType(
+        {
+            'info': definition.info,
+            'mks': types.MappingProxyType(
+                {'unit': definition.mks_unit, 'value': definition.mks_value}
+            ),
+            'cgs': types.MappingProxyType(
+                {'unit': definition.cgs_unit, 'value': definition.cgs_value}
+            ),
+            'quantity': definition.quantity,
         }
-        for k in ('mks', 'cgs')
-    },
-    'quantity': 'energy',
-}
-_constants['MeV'] = {
-    'info': _constants['eV']['info'].replace('eV', 'MeV'),
-    **{
-        k: {
-            'unit': _constants['eV'][k]['unit'],
-            'value': 1e6 * _constants['eV'][k]['value'],
-        }
-        for k in ('mks', 'cgs')
-    },
-    'quantity': 'energy',
-}
-
-
-def _normalize(
-    defined: typing.Dict[str, typing.Dict[str, typing.Any]],
-) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
-    """Normalize constant definitions."""
-    systems = ('mks', 'cgs')
-    norm = {}
-    for key, definition in defined.items():
-        if 'all' in definition:
-            value = definition.pop('all')
-            new = {k: {'unit': '1', 'value': value} for k in systems}
-            definition.update(new)
-        norm[key] = definition
-    return norm
+    )
 
 
 # NOTE: I'm not sure that this needs to be an aliased mapping.
-CONSTANTS = aliased.Mapping(_normalize(_constants))
+CONSTANTS = aliased.Mapping(
+    {key: _freeze(definition) for key, definition in _DEFINITIONS.items()}
+)
+"""Read-only definitions of all universal constants."""
+
+
+def _tabulate(system: str):
+    """Collect the value, unit, quantity, and info of constants in `system`."""
+    fields = operator.attrgetter(
+        f'{system}_value',
+        f'{system}_unit',
+        'quantity',
+        'info',
+    )
+    return aliased.Mapping(
+        {key: fields(definition) for key, definition in _DEFINITIONS.items()}
+    )
+
+
+_TABLES = {system: _tabulate(system) for system in ('mks', 'cgs')}
+"""Pre-computed tables of constants in each supported metric system."""
+
+
+def _readonly(array: numpy.ndarray):
+    """Prevent in-place updates to `array` and return it."""
+    array.setflags(write=False)
+    return array
+
+
+_NAMES = _readonly(numpy.array(list(_DEFINITIONS)))
+"""The name of each constant, in iteration order."""
+
+_QUANTITIES = _readonly(
+    numpy.array([definition.quantity for definition in _DEFINITIONS.values()])
+)
+"""The metric quantity of each constant, aligned with `_NAMES`."""
+
+_VALUES = {
+    system: _readonly(
+        numpy.array(
+            [record[0] for record in _TABLES[system].values()],
+            dtype=numpy.float64,
+        )
+    )
+    for system in ('mks', 'cgs')
+}
+"""The value of each constant in each metric system, aligned with `_NAMES`."""
 
 
 class Constant(measured.Value[real.ValueType]):
@@ -236,7 +334,8 @@ class Constants(collections.abc.Mapping):
     """Universal physical constants in a given metric system."""
     def __init__(self, system: str) -> None:
         self.system = system.lower()
-        self._mapping = CONSTANTS.copy()
+        self._mapping = CONSTANTS
+        self._table = _TABLES[self.system]
 
     def __len__(self) -> int:
         """The number of defined constants."""
@@ -249,17 +348,27 @@ class Constants(collections.abc.Mapping):
     def __getitem__(self, name: str):
         """Create the named constant or raise an error."""
         try:
-            definition = self._mapping[name]
+            record = self._table[name]
         except KeyError as err:
             raise KeyError(f"Unknown constant: {name!r}") from err
-        return self._create(definition)
-
-    def _create(self, definition: dict):
-        """Create a constant object from the given definition."""
-        value = definition[self.system]['value']
-        unit = definition[self.system]['unit']
-        quantity = definition['quantity']
-        info = definition['info']
+        return self._create(record)
+
+    def values_array(self) -> numpy.ndarray:
+        """The values of all constants in this system, as a read-only array.
+
+        The order of values is the same as the order of names when iterating
+        over this object.
+        """
+        return _VALUES[self.system]
+
+    def by_quantity(self, quantity: str) -> typing.Tuple[str, ...]:
+        """The names of all constants of the given metric quantity."""
+        indices = numpy.flatnonzero(_QUANTITIES == quantity)
+        return tuple(str(name) for name in _NAMES[indices])
+
+    def _create(self, record: tuple):
+        """Create a constant object from the given table record."""
+        value, unit, quantity, info = record
         x = measured.value(value, unit=unit)
         return Constant(x, quantity, info)
 
@@ -1,138 +1,203 @@
+import collections
+import copy
+import functools
 import pathlib
+import types
 import typing
 
 import numpy
 import pytest
 
 import support
+from eprempy import datafile
+
+
+_ROOT = pathlib.Path(__file__).expanduser().resolve().parent
+"""The path containing `tests` and `data` directories."""
+
+
+_r = [ # (3, 2)
+    [+1.0, +2.0],
+    [+2.0, -3.0],
+    [-4.0, +6.0],
+]
+_xy = [ # (3, 2)
+    [+10.0, +20.0],
+    [-20.0, -30.0],
+    [+40.0, +60.0],
+]
+_yz = [ # (2, 4)
+    [+4.0, -4.0, +4.0, -4.0],
+    [-6.0, +6.0, -6.0, +6.0],
+]
+_zw = [ # (4, 5)
+    [+1.0, +2.0, +3.0, +4.0, +5.0],
+    [-1.0, -2.0, -3.0, -4.0, -5.0],
+    [+5.0, +4.0, +3.0, +2.0, +1.0],
+    [-5.0, -4.0, -3.0, -2.0, -1.0],
+]
+_xyz = [ # (3, 2, 4)
+    [
+        [+4.0, -4.0, +4.0, -4.0],
+        [-6.0, +6.0, -6.0, +6.0],
+    ],
+    [
+        [+16.0, -16.0, +4.0, -4.0],
+        [-6.0, +6.0, -18.0, +18.0],
+    ],
+    [
+        [-4.0, +4.0, -4.0, +4.0],
+        [+6.0, -6.0, +6.0, -6.0],
+    ],
+]
+
+
+def _readonly(array: numpy.ndarray) -> numpy.ndarray:
+    """Prevent tests from modifying a shared array in place."""
+    array.setflags(write=False)
+    return array
+
+
+_NDARRAYS = support.NDArrays(
+    r=_readonly(numpy.array(_r)),
+    xy=_readonly(numpy.array(_xy)),
+    yz=_readonly(numpy.array(_yz)),
+    zw=_readonly(numpy.array(_zw)),
+    xyz=_readonly(numpy.array(_xyz)),
+)
+"""Read-only base arrays, shared by all tests that request `ndarrays`."""
+
+
+_Case = support.MeasurableCase
+
+_unity = '1'
+_UNITLESS = (
+    _Case(test=1.1,    full=(1.1, _unity), dist=((1.1, _unity),)),
+    _Case(test=(1.1,), full=(1.1, _unity), dist=((1.1, _unity),)),
+    _Case(test=[1.1],  full=(1.1, _unity), dist=((1.1, _unity),)),
+    _Case(
+        test=(1.1, 2.3),
+        full=(1.1, 2.3, _unity),
+        dist=((1.1, _unity), (2.3, _unity)),
+    ),
+    _Case(
+        test=[1.1, 2.3],
+        full=(1.1, 2.3, _unity),
+        dist=((1.1, _unity), (2.3, _unity)),
+    ),
+)
+
+_meter = 'm'
+_WITHUNIT = (
+    _Case(test=(1.1, _meter), full=(1.1, _meter), dist=((1.1, _meter),)),
+    _Case(test=[1.1, _meter], full=(1.1, _meter), dist=((1.1, _meter),)),
+    _Case(
+        test=(1.1, 2.3, _meter),
+        full=(1.1, 2.3, _meter),
+        dist=((1.1, _meter), (2.3, _meter))
+    ),
+    _Case(
+        test=[1.1, 2.3, _meter],
+        full=(1.1, 2.3, _meter),
+        dist=((1.1, _meter), (2.3, _meter)),
+    ),
+    _Case(
+        test=[(1.1, 2.3), _meter],
+        full=(1.1, 2.3, _meter),
+        dist=((1.1, _meter), (2.3, _meter)),
+    ),
+    _Case(
+        test=[[1.1, 2.3], _meter],
+        full=(1.1, 2.3, _meter),
+        dist=((1.1, _meter), (2.3, _meter)),
+    ),
+    _Case(
+        test=((1.1, _meter), (2.3, _meter)),
+        full=(1.1, 2.3, _meter),
+        dist=((1.1, _meter), (2.3, _meter)),
+    ),
+    _Case(
+        test=[(1.1, _meter), (2.3, _meter)],
+        full=(1.1, 2.3, _meter),
+        dist=((1.1, _meter), (2.3, _meter)),
+    ),
+    _Case(
+        test=[(1.1, _meter), (2.3, 5.8, _meter)],
+        full=(1.1, 2.3, 5.8, _meter),
+        dist=((1.1, _meter), (2.3, _meter), (5.8, _meter)),
+    ),
+)
+
+_MEASURABLES = (*_UNITLESS, *_WITHUNIT)
+"""Implicitly measurable test objects and their expected parsed forms."""
+
+
+def _cached(build):
+    """Build a fixture value once, then give each test a deep copy of it.
+
+    This allows expensive fixtures to run only once per session without
+    letting one test's modifications leak into another test.
+    """
+    @functools.wraps(build)
+    def wrapper(*args, **kwargs):
+        if not hasattr(wrapper, 'value'):
+            wrapper.value = build(*args, **kwargs)
+        return copy.deepcopy(wrapper.value)
+    return wrapper
 
 
 @pytest.fixture(scope='package')
 def measurables():
     """Implicitly measurable sequences."""
-
-    unity = '1'
-    unitless = [
-        {'test': 1.1,    'full': (1.1, unity), 'dist': ((1.1, unity),)},
-        {'test': (1.1,), 'full': (1.1, unity), 'dist': ((1.1, unity),)},
-        {'test': [1.1],  'full': (1.1, unity), 'dist': ((1.1, unity),)},
-        {
-            'test': (1.1, 2.3),
-            'full': (1.1, 2.3, unity),
-            'dist': ((1.1, unity), (2.3, unity)),
-        },
-        {
-            'test': [1.1, 2.3],
-            'full': (1.1, 2.3, unity),
-            'dist': ((1.1, unity), (2.3, unity)),
-        },
-    ]
-    meter = 'm'
-    withunit = [
-        {'test': (1.1, meter), 'full': (1.1, meter), 'dist': ((1.1, meter),)},
-        {'test': [1.1, meter], 'full': (1.1, meter), 'dist': ((1.1, meter),)},
-        {
-            'test': (1.1, 2.3, meter),
-            'full': (1.1, 2.3, meter),
-            'dist': ((1.1, meter), (2.3, meter))
-        },
-        {
-            'test': [1.1, 2.3, meter],
-            'full': (1.1, 2.3, meter),
-            'dist': ((1.1, meter), (2.3, meter)),
-        },
-        {
-            'test': [(1.1, 2.3), meter],
-            'full': (1.1, 2.3, meter),
-            'dist': ((1.1, meter), (2.3, meter)),
-        },
-        {
-            'test': [[1.1, 2.3], meter],
-            'full': (1.1, 2.3, meter),
-            'dist': ((1.1, meter), (2.3, meter)),
-        },
-        {
-            'test': ((1.1, meter), (2.3, meter)),
-            'full': (1.1, 2.3, meter),
-            'dist': ((1.1, meter), (2.3, meter)),
-        },
-        {
-            'test': [(1.1, meter), (2.3, meter)],
-            'full': (1.1, 2.3, meter),
-            'dist': ((1.1, meter), (2.3, meter)),
-        },
-        {
-            'test': [(1.1, meter), (2.3, 5.8, meter)],
-            'full': (1.1, 2.3, 5.8, meter),
-            'dist': ((1.1, meter), (2.3, meter), (5.8, meter)),
-        },
-    ]
-    return [
-        *unitless,
-        *withunit,
-    ]
+    return _MEASURABLES
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def ndarrays():
     """Base `numpy` arrays for tests."""
-    r = [ # (3, 2)
-        [+1.0, +2.0],
-        [+2.0, -3.0],
-        [-4.0, +6.0],
-    ]
-    xy = [ # (3, 2)
-        [+10.0, +20.0],
-        [-20.0, -30.0],
-        [+40.0, +60.0],
-    ]
-    yz = [ # (2, 4)
-        [+4.0, -4.0, +4.0, -4.0],
-        [-6.0, +6.0, -6.0, +6.0],
-    ]
-    zw = [ # (4, 5)
-        [+1.0, +2.0, +3.0, +4.0, +5.0],
-        [-1.0, -2.0, -3.0, -4.0, -5.0],
-        [+5.0, +4.0, +3.0, +2.0, +1.0],
-        [-5.0, -4.0, -3.0, -2.0, -1.0],
-    ]
-    xyz = [ # (3, 2, 4)
-        [
-            [+4.0, -4.0, +4.0, -4.0],
-            [-6.0, +6.0, -6.0, +6.0],
-        ],
-        [
-            [+16.0, -16.0, +4.0, -4.0],
-            [-6.0, +6.0, -18.0, +18.0],
-        ],
-        [
-            [-4.0, +4.0, -4.0, +4.0],
-            [+6.0, -6.0, +6.0, -6.0],
-        ],
-    ]
-    return support.NDArrays(
-        r=numpy.array(r),
-        xy=numpy.array(xy),
-        yz=numpy.array(yz),
-        zw=numpy.array(zw),
-        xyz=numpy.array(xyz),
-    )
+    return _NDARRAYS
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def rootpath():
     """The path containing `tests` and `data` directories."""
-    cwd = pathlib.Path(__file__).expanduser().resolve()
-    return cwd.parent
+    return _ROOT
 
 
-@pytest.fixture
-def datadir(rootpath: pathlib.Path):
+@pytest.fixture(scope='session')
+def datadir():
     """The top-level directory containing test data."""
-    return rootpath / 'data'
+    return _ROOT / 'data'
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
+def flux_source(datadir: pathlib.Path) -> pathlib.Path:
+    """The directory of the isotropic-shock dataset with flux output."""
+    return datadir / 'isotropic-shock-with-flux'
+
+
+@pytest.fixture(scope='session')
+def dist_source(datadir: pathlib.Path) -> pathlib.Path:
+    """The directory of the isotropic-shock dataset with distribution data."""
+    return datadir / 'isotropic-shock-with-dist'
+
+
+@pytest.fixture(scope='session')
+def datafile_view():
+    """Get a view of a data file, opening each file once per session."""
+    return functools.lru_cache(maxsize=None)(datafile.view)
+
+
+@pytest.fixture(scope='session')
+def datafile_arrays():
+    """Get the arrays in a data file, creating each set once per session."""
+    @functools.lru_cache(maxsize=None)
+    def get(path: pathlib.Path, system: str):
+        return datafile.arrays(path, system=system)
+    return get
+
+
+@pytest.fixture(scope='session')
 def datasets():
     """A collection of dataset directory attributes."""
     return {
@@ -156,6 +221,7 @@ def datasets():
 
 
 @pytest.fixture
+@_cached
 def config(
     datadir: pathlib.Path,
     datasets: typing.Dict[str, typing.Dict[str, str]]
@@ -220,40 +286,74 @@ def config(
         'idealShockWidth': 0.0,
         'idealShockFalloff': 0.0,
     }
-    shock_dist = {**common, **shock_on, 'streamFluxOutput': 0}
-    shock_flux = {**common, **shock_on, 'streamFluxOutput': 1}
-    wind_dist = {**common, 'idealShock': 0, 'streamFluxOutput': 0}
-    wind_flux = {**common, 'idealShock': 0, 'streamFluxOutput': 1}
+    shock_dist = collections.ChainMap({'streamFluxOutput': 0}, shock_on, common)
+    shock_flux = collections.ChainMap({'streamFluxOutput': 1}, shock_on, common)
+    wind_dist = collections.ChainMap(
+        {'idealShock': 0, 'streamFluxOutput': 0},
+        common,
+    )
+    wind_flux = collections.ChainMap(
+        {'idealShock': 0, 'streamFluxOutput': 1},
+        common,
+    )
     built = {
         'isotropic-shock-with-dist': {'args': shock_dist},
         'isotropic-shock-with-flux': {'args': shock_flux},
         'wind-with-dist': {'args': wind_dist},
         'wind-with-flux': {'args': wind_flux},
     }
-    for k, v in built.items():
-        v['path'] = (datadir / k / datasets[k]['config'])
-    return built
+    return {
+        k: {**v, 'path': datadir / k / datasets[k]['config']}
+        for k, v in built.items()
+    }
 
 
 T, S, P, E, M = 'time', 'shell', 'species', 'energy', 'mu'
 
+_D_T = (T,)
+_D_S = (S,)
+_D_P = (P,)
+_D_PE = (P, E)
+_D_TS = (T, S)
+_D_TSP = (T, S, P)
+_D_TSPE = (T, S, P, E)
+_D_TSPEM = (T, S, P, E, M)
+"""Dimensions shared by several observable quantities."""
 
-@pytest.fixture
-def primary():
-    """The primary observable quantities."""
+_U_UNITY = {'mks': '1', 'cgs': '1'}
+_U_TIME = {'mks': 's', 'cgs': 's'}
+_U_RATE = {'mks': '1 / s', 'cgs': '1 / s'}
+_U_LENGTH = {'mks': 'm', 'cgs': 'cm'}
+_U_SPEED = {'mks': 'm / s', 'cgs': 'cm / s'}
+_U_ENERGY = {'mks': 'J', 'cgs': 'erg'}
+_U_ANGLE = {'mks': 'rad', 'cgs': 'rad'}
+_U_MAGNETIC = {'mks': 'T', 'cgs': 'G'}
+"""Metric units shared by several observable quantities."""
+
+
+_OBSERVABLES_DATASET = 'isotropic-shock-with-dist'
+"""The dataset whose quantities define the `observables` fixture."""
+
+_NOT_OBSERVABLE = frozenset({'shell', 'phiOffset', 'egrid', 'vgrid'})
+"""Quantities that the `observables` fixture excludes."""
+
+
+@_cached
+def _primary():
+    """Build the primary observable quantities."""
     common = {
         'time': {
-            'unit': {'mks': 's', 'cgs': 's'},
-            'dimensions': (T,),
+            'unit': _U_TIME,
+            'dimensions': _D_T,
             'aliases': ['t', 'times'],
         },
         'shell': {
-            'unit': {'mks': '1', 'cgs': '1'},
-            'dimensions': (S,),
+            'unit': _U_UNITY,
+            'dimensions': _D_S,
             'aliases': ['shells'],
         },
         'mu': {
-            'unit': {'mks': '1', 'cgs': '1'},
+            'unit': _U_UNITY,
             'dimensions': (M,),
             'aliases': [
                 'mu',
@@ -262,96 +362,104 @@ def primary():
             ],
         },
         'phiOffset': {
-            'unit': {'mks': 's', 'cgs': 's'},
-            'dimensions': (T,),
+            'unit': _U_TIME,
+            'dimensions': _D_T,
             'aliases': [],
         },
         'mass': {
             'unit': {'mks': 'kg', 'cgs': 'g'},
-            'dimensions': (P,),
+            'dimensions': _D_P,
             'aliases': ['m'],
         },
         'charge': {
             'unit': {'mks': 'C', 'cgs': 'statC'},
-            'dimensions': (P,),
+            'dimensions': _D_P,
             'aliases': ['q'],
         },
         'energy': {
-            'unit': {'mks': 'J', 'cgs': 'erg'},
-            'dimensions': (P, E),
+            'unit': _U_ENERGY,
+            'dimensions': _D_PE,
             'aliases': ['energies', 'E'],
         },
         'v': {
-            'unit': {'mks': 'm / s', 'cgs': 'cm / s'},
-            'dimensions': (P, E),
+            'unit': _U_SPEED,
+            'dimensions': _D_PE,
             'aliases': ['speed'],
         },
         'r': {
-            'unit': {'mks': 'm', 'cgs': 'cm'},
-            'dimensions': (T, S),
+            'unit': _U_LENGTH,
+            'dimensions': _D_TS,
             'aliases': ['radius'],
         },
         'theta': {
-            'unit': {'mks': 'rad', 'cgs': 'rad'},
-            'dimensions': (T, S),
+            'unit': _U_ANGLE,
+            'dimensions': _D_TS,
             'aliases': [],
         },
         'phi': {
-            'unit': {'mks': 'rad', 'cgs': 'rad'},
-            'dimensions': (T, S),
+            'unit': _U_ANGLE,
+            'dimensions': _D_TS,
             'aliases': [],
         },
         'br': {
-            'unit': {'mks': 'T', 'cgs': 'G'},
-            'dimensions': (T, S),
+            'unit': _U_MAGNETIC,
+            'dimensions': _D_TS,
             'aliases': ['Br'],
         },
         'btheta': {
-            'unit': {'mks': 'T', 'cgs': 'G'},
-            'dimensions': (T, S),
+            'unit': _U_MAGNETIC,
+            'dimensions': _D_TS,
             'aliases': ['bt', 'Btheta', 'Bt'],
         },
         'bphi': {
-            'unit': {'mks': 'T', 'cgs': 'G'},
-            'dimensions': (T, S),
+            'unit': _U_MAGNETIC,
+            'dimensions': _D_TS,
             'aliases': ['bp', 'Bphi', 'Bp'],
         },
         'ur': {
-            'unit': {'mks': 'm / s', 'cgs': 'cm / s'},
-            'dimensions': (T, S),
+            'unit': _U_SPEED,
+            'dimensions': _D_TS,
             'aliases': ['Ur', 'Vr', 'vr'],
         },
         'utheta': {
-            'unit': {'mks': 'm / s', 'cgs': 'cm / s'},
-            'dimensions': (T, S),
+            'unit': _U_SPEED,
+            'dimensions': _D_TS,
             'aliases': ['ut', 'Utheta', 'Ut', 'Vtheta', 'Vt'],
         },
         'uphi': {
-            'unit': {'mks': 'm / s', 'cgs': 'cm / s'},
-            'dimensions': (T, S),
+            'unit': _U_SPEED,
+            'dimensions': _D_TS,
             'aliases': ['up', 'Uphi', 'Up', 'Vphi', 'Vp'],
         },
         'rho': {
             'unit': {'mks': 'm^-3', 'cgs': 'cm^-3'},
-            'dimensions': (T, S),
+            'dimensions': _D_TS,
             'aliases': ['Rho'],
         },
     }
-    dist = common.copy()
-    dist['f'] = {
-        'unit': {'mks': 's^3 / m^6', 'cgs': 's^3 / cm^6'},
-        'dimensions': (T, S, P, E, M),
-        'aliases': ['dist', 'Dist'],
-    }
-    flux = common.copy()
-    flux['flux'] = {
-        'unit': {
-            'mks': 'm^-2 s^-1 sr^-1 J^-1',
-            'cgs': 'cm^-2 s^-1 sr^-1 erg^-1',
-        },
-        'dimensions': (T, S, P, E),
-        'aliases': ['Flux', 'J', 'J(E)', 'j', 'j(E)'],
-    }
+    dist = collections.ChainMap(
+        {
+            'f': {
+                'unit': {'mks': 's^3 / m^6', 'cgs': 's^3 / cm^6'},
+                'dimensions': _D_TSPEM,
+                'aliases': ['dist', 'Dist'],
+            },
+        },
+        common,
+    )
+    flux = collections.ChainMap(
+        {
+            'flux': {
+                'unit': {
+                    'mks': 'm^-2 s^-1 sr^-1 J^-1',
+                    'cgs': 'cm^-2 s^-1 sr^-1 erg^-1',
+                },
+                'dimensions': _D_TSPE,
+                'aliases': ['Flux', 'J', 'J(E)', 'j', 'j(E)'],
+            },
+        },
+        common,
+    )
     return {
         'isotropic-shock-with-dist': dist,
         'isotropic-shock-with-flux': flux,
@@ -361,89 +469,125 @@ def primary():
 
 
 @pytest.fixture
+def primary():
+    """The primary observable quantities."""
+    return _primary()
+
+
+@pytest.fixture(scope='session')
+def primary_layout() -> typing.Mapping[
+    str,
+    typing.Tuple[typing.Mapping[str, tuple], typing.Mapping[str, dict]],
+]:
+    """The dimensions and per-system units of primary quantities by dataset.
+
+    Every level of this mapping is read-only, so tests may safely share it.
+    """
+    return types.MappingProxyType(
+        {
+            rundir: (
+                types.MappingProxyType(
+                    {k: v['dimensions'] for k, v in current.items()}
+                ),
+                types.MappingProxyType(
+                    {
+                        s: types.MappingProxyType(
+                            {k: v['unit'][s] for k, v in current.items()}
+                        )
+                        for s in ('mks', 'cgs')
+                    }
+                ),
+            )
+            for rundir, current in _primary().items()
+        }
+    )
+
+
+@pytest.fixture
+@_cached
 def derived(
     primary: typing.Dict[str, typing.Dict[str, typing.Dict[str, typing.Any]]],
 ) -> typing.Dict[str, typing.Dict[str, typing.Dict[str, typing.Any]]]:
     """The derived observable quantities."""
     default = {
         'x': {
-            'unit': {'mks': 'm', 'cgs': 'cm'},
-            'dimensions': (T, S),
+            'unit': _U_LENGTH,
+            'dimensions': _D_TS,
             'aliases': ['X'],
         },
         'y': {
-            'unit': {'mks': 'm', 'cgs': 'cm'},
-            'dimensions': (T, S),
+            'unit': _U_LENGTH,
+            'dimensions': _D_TS,
             'aliases': ['Y'],
         },
         'z': {
-            'unit': {'mks': 'm', 'cgs': 'cm'},
-            'dimensions': (T, S),
+            'unit': _U_LENGTH,
+            'dimensions': _D_TS,
             'aliases': ['Z'],
         },
         'bmag': {
-            'unit': {'mks': 'T', 'cgs': 'G'},
-            'dimensions': (T, S),
+            'unit': _U_MAGNETIC,
+            'dimensions': _D_TS,
             'aliases': ['B', 'b', '|B|', '|b|', 'b_mag', 'b mag'],
         },
         'umag': {
-            'unit': {'mks': 'm / s', 'cgs': 'cm / s'},
-            'dimensions': (T, S),
+            'unit': _U_SPEED,
+            'dimensions': _D_TS,
             'aliases': ['U', 'u', '|U|', '|u|', 'u_mag', 'u mag'],
         },
         'upara': {
-            'unit': {'mks': 'm / s', 'cgs': 'cm / s'},
-            'dimensions': (T, S),
+            'unit': _U_SPEED,
+            'dimensions': _D_TS,
             'aliases': ['Upara', 'u_para'],
         },
         'uperp': {
-            'unit': {'mks': 'm / s', 'cgs': 'cm / s'},
-            'dimensions': (T, S),
+            'unit': _U_SPEED,
+            'dimensions': _D_TS,
             'aliases': ['Uperp', 'u_perp'],
         },
         'angle': {
-            'unit': {'mks': 'rad', 'cgs': 'rad'},
-            'dimensions': (T, S),
+            'unit': _U_ANGLE,
+            'dimensions': _D_TS,
             'aliases': ['flow_angle', 'flow angle'],
         },
         'divu': {
-            'unit': {'mks': '1 / s', 'cgs': '1 / s'},
-            'dimensions': (T, S),
+            'unit': _U_RATE,
+            'dimensions': _D_TS,
             'aliases': ['div_u', 'divU', 'div U', 'div u', 'div(U)', 'div(u)'],
         },
         'density_ratio': {
             'unit': {'mks': 'kg / m^3', 'cgs': 'g / cm^3'},
-            'dimensions': (T, S),
+            'dimensions': _D_TS,
             'aliases': ['density ratio' ,'n2/n1', 'n_2/n_1'],
         },
         'rigidity': {
             'unit': {'mks': 'kg m / (A s^2)', 'cgs': 'g cm / (statA s^2)'},
-            'dimensions': (P, E),
+            'dimensions': _D_PE,
             'aliases': ['Rg', 'R_g'],
         },
         'mfp': {
-            'unit': {'mks': 'm', 'cgs': 'cm'},
-            'dimensions': (T, S, P, E),
+            'unit': _U_LENGTH,
+            'dimensions': _D_TSPE,
             'aliases': ['mean_free_path', 'mean free path'],
         },
         'ar': {
-            'unit': {'mks': '1 / s', 'cgs': '1 / s'},
-            'dimensions': (T, S, P, E),
+            'unit': _U_RATE,
+            'dimensions': _D_TSPE,
             'aliases': ['acceleration_rate', 'acceleration rate'],
         },
         'energy_density': {
             'unit': {'mks': 'J / m^3', 'cgs': 'erg / cm^3'},
-            'dimensions': (T, S, P),
+            'dimensions': _D_TSP,
             'aliases': ['energy density'],
         },
         'average_energy': {
-            'unit': {'mks': 'J', 'cgs': 'erg'},
-            'dimensions': (T, S, P),
+            'unit': _U_ENERGY,
+            'dimensions': _D_TSP,
             'aliases': ['average energy'],
         },
         'fluence': {
             'unit': {'mks': '# / (m^2 sr J)', 'cgs': '# / (cm^2 sr erg)'},
-            'dimensions': (T, S, P, E),
+            'dimensions': _D_TSPE,
             'aliases': [],
         },
         'intflux': {
@@ -452,8 +596,10 @@ def derived(
             'aliases': ['integral_flux', 'integral flux'],
         },
     }
-    obsdist = default.copy()
-    obsdist['flux'] = primary['isotropic-shock-with-flux']['flux'].copy()
+    obsdist = collections.ChainMap(
+        {'flux': primary['isotropic-shock-with-flux']['flux'].copy()},
+        default,
+    )
     return {
         'isotropic-shock-with-dist': obsdist,
         'isotropic-shock-with-flux': default,
@@ -463,15 +609,10 @@ def derived(
 
 
 @pytest.fixture
+@_cached
 def observables(primary, derived):
     """All observable quantities."""
-    excluded = {
-        'shell',
-        'phiOffset',
-        'egrid',
-        'vgrid',
-    }
-    name = 'isotropic-shock-with-dist'
+    name = _OBSERVABLES_DATASET
     merged = {**primary[name], **derived[name]}
-    return {k: v for k, v in merged.items() if k not in excluded}
+    return {k: v for k, v in merged.items() if k not in _NOT_OBSERVABLE}
 
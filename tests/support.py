@@ -1,6 +1,7 @@
 """
 Utilities for `eprem` tests.
 """
+import functools
 import numbers
 import typing
 
@@ -12,6 +13,10 @@ from eprempy import metric
 from eprempy import quantity
 
 
+_unit = functools.lru_cache(maxsize=128)(metric.unit)
+"""A memoized version of `metric.unit`, for hashable unit-like arguments."""
+
+
 class Measurable:
     """An explicitly measurable object for tests.
     
@@ -23,12 +28,22 @@ class Measurable:
 
     def __init__(self, x, /, unit=None) -> None:
         self._x = x
-        self._unit = metric.unit(unit or '1')
+        self._unit = _unit(unit or '1')
 
     def __measure__(self) -> quantity.Measurement:
         return quantity.measurement(self._x, unit=self._unit)
 
 
+class MeasurableCase(typing.NamedTuple):
+    """A measurable object and the expected results of parsing it."""
+    test: typing.Any
+    """The object to parse."""
+    full: tuple
+    """The expected result of parsing `test`."""
+    dist: tuple
+    """The expected result of parsing `test` with `distribute=True`."""
+
+
 class NDArrays(typing.NamedTuple):
     """The container of base `numpy` arrays."""
     r: numpy.typing.NDArray
@@ -71,21 +86,25 @@ def operation(
 
     Returns
     -------
-    list
-        A possibly nested list containing the element-wise result of `f`. The
-        shape of the equivalent array will be consistent with the unique
-        elements of `dimensions`.
+    `numpy.ndarray`
+        The element-wise result of `f`. The shape of the array will be
+        consistent with the unique elements of `dimensions`.
 
     Notes
     -----
     This was created to help generalize tests of binary arithmetic operators on
-    array-like objects. The way in which it builds arrays is not especially
-    Pythonic; instead, the goal is to indicate how the structure of the
-    resultant array arises from the structure of the operands.
+    array-like objects. It broadcasts `a` and `b` against each other by
+    inserting a new axis for each dimension that one operand lacks, so `f` must
+    support `numpy` arrays.
     """
-    x = float(a) if isinstance(a, numbers.Real) else numpy.array(a)
-    y = float(b) if isinstance(b, numbers.Real) else numpy.array(b)
-    return numpy.array(_compute(f, x, y, dimensions=dimensions))
+    if isinstance(a, numbers.Real) and isinstance(b, numbers.Real):
+        raise TypeError("Expected one of a or b to be an array")
+    x = float(a) if isinstance(a, numbers.Real) else numpy.asarray(a)
+    y = float(b) if isinstance(b, numbers.Real) else numpy.asarray(b)
+    result = _compute(f, x, y, dimensions=dimensions)
+    if isinstance(result, numpy.ndarray):
+        return result
+    return numpy.asarray(result)
 
 
 def _compute(
@@ -93,104 +112,51 @@ def _compute(
     a: typing.Union[numpy.typing.NDArray, float],
     b: typing.Union[numpy.typing.NDArray, float],
     dimensions: typing.Iterable[typing.Iterable[str]]=None,
-) -> list:
-    """Computation logic for `~support.operation`."""
-    if isinstance(a, float) and isinstance(b, float):
-        raise TypeError("Expected one of a or b to be an array")
-    if not isinstance(a, float):
-        I = range(len(a))
-        J = range(len(a[0]))
-    if not isinstance(b, float):
-        P = range(len(b))
-        Q = range(len(b[0]))
-    if isinstance(b, float):
-        return [
-            # I x J
-            [
-                f(a[i][j], b) for j in J
-            ] for i in I
-        ]
-    if isinstance(a, float):
-        return [
-            # P x Q
-            [
-                f(a, b[p][q]) for q in Q
-            ] for p in P
-        ]
+) -> numpy.typing.NDArray:
+    """Computation logic for `~support.operation`.
+
+    This function assumes that at least one of `a` or `b` is an array.
+    """
+    if isinstance(a, float) or isinstance(b, float):
+        # I x J or P x Q
+        return f(a, b)
     a_dims, b_dims = dimensions
     if a_dims[0] == b_dims[0] and a_dims[1] == b_dims[1]:
-        # {x, y} * {x, y} -> {x, y}
-        return [
-            # I x J
-            [
-                # J
-                f(a[i][j], b[i][j]) for j in J
-            ] for i in I
-        ]
+        # {x, y} * {x, y} -> {x, y}: I x J
+        return f(a, b)
     if a_dims[0] == b_dims[0]:
-        # {x, y} * {x, z} -> {x, y, z}
-        return [
-            # I x J x Q
-            [
-                # J x Q
-                [
-                    # Q
-                    f(a[i][j], b[i][q]) for q in Q
-                ] for j in J
-            ] for i in I
-        ]
+        # {x, y} * {x, z} -> {x, y, z}: I x J x Q
+        return f(a[:, :, None], b[:, None, :])
     if a_dims[1] == b_dims[0]:
-        # {x, y} * {y, z} -> {x, y, z}
-        return [
-            # I x J x Q
-            [
-                # J x Q
-                [
-                    # Q
-                    f(a[i][j], b[j][q]) for q in Q
-                ] for j in J
-            ] for i in I
-        ]
+        # {x, y} * {y, z} -> {x, y, z}: I x J x Q
+        return f(a[:, :, None], b[None, :, :])
     if a_dims[0] == b_dims[1]:
-        # {y, z} * {x, y} -> {x, y, z}
-        return [
-            # P x I x J
-            [
-                # I x J
-                [
-                    # J
-                    f(a[i][j], b[p][i]) for j in J
-                ] for i in I
-            ] for p in P
-        ]
-    # {x, y} * {z, w} -> {x, y, z, w}
-    return [
-        # I x J x P x Q
-        [
-            # J x P x Q
-            [
-                # P x Q
-                [
-                    # Q
-                    f(a[i][j], b[p][q]) for q in Q
-                ] for p in P
-            ] for j in J
-        ] for i in I
-    ]
+        # {y, z} * {x, y} -> {x, y, z}: P x I x J
+        return f(a[None, :, :], b[:, :, None])
+    # {x, y} * {z, w} -> {x, y, z, w}: I x J x P x Q
+    return f(a[:, :, None, None], b[None, None, :, :])
+
+
+def _operand_kind(x) -> typing.Optional[type]:
+    """Classify `x` for `~support.compute_unit`."""
+    for kind in (measured.Object, numbers.Real, tuple):
+        if isinstance(x, kind):
+            return kind
+
+
+_UNIT_HANDLERS = {
+    (measured.Object, measured.Object): lambda f, a, b: f(a.unit, b.unit),
+    (numbers.Real, measured.Object): lambda f, a, b: f('1', b.unit),
+    (measured.Object, numbers.Real): lambda f, a, b: a.unit,
+    (tuple, measured.Object): lambda f, a, b: f(a[-1], b.unit),
+    (measured.Object, tuple): lambda f, a, b: f(a.unit, b[-1]),
+}
+"""Rules for computing the unit of a result, keyed by operand kinds."""
 
 
 def compute_unit(f, a, b):
     """Apply `f` to the operands' unit(s)."""
-    if isinstance(a, measured.Object) and isinstance(b, measured.Object):
-        return f(a.unit, b.unit)
-    if isinstance(a, numbers.Real) and isinstance(b, measured.Object):
-        return f('1', b.unit)
-    if isinstance(a, measured.Object) and isinstance(b, numbers.Real):
-        return a.unit
-    if isinstance(a, tuple) and isinstance(b, measured.Object):
-        return f(a[-1], b.unit)
-    if isinstance(a, measured.Object) and isinstance(b, tuple):
-        return f(a.unit, b[-1])
+    key = (_operand_kind(a), _operand_kind(b))
+    if handler := _UNIT_HANDLERS.get(key):
+        return handler(f, a, b)
     raise TypeError(a, b)
-
-
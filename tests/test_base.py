@@ -12,10 +12,13 @@ class Empty:
     __ge__ = None
 
 
-@pytest.fixture
+_EMPTY = Empty()
+
+
+@pytest.fixture(scope='session')
 def empty():
     """Create an empty test quantity."""
-    return Empty()
+    return _EMPTY
 
 
 def trivial(*args, **kwargs):
@@ -29,10 +32,13 @@ class Ordered:
     __ge__ = trivial
 
 
-@pytest.fixture
+_ORDERED = Ordered()
+
+
+@pytest.fixture(scope='session')
 def ordered():
     """Create an ordered test quantity."""
-    return Ordered()
+    return _ORDERED
 
 
 class Comparable(Ordered):
@@ -40,10 +46,13 @@ class Comparable(Ordered):
     __ne__ = trivial
 
 
-@pytest.fixture
+_COMPARABLE = Comparable()
+
+
+@pytest.fixture(scope='session')
 def comparable():
     """Create an comparable test quantity."""
-    return Comparable()
+    return _COMPARABLE
 
 
 class Additive:
@@ -53,10 +62,13 @@ class Additive:
     __rsub__ = trivial
 
 
-@pytest.fixture
+_ADDITIVE = Additive()
+
+
+@pytest.fixture(scope='session')
 def additive():
     """Create an additive test quantity."""
-    return Additive()
+    return _ADDITIVE
 
 
 class Multiplicative:
@@ -66,20 +78,26 @@ class Multiplicative:
     __rtruediv__ = trivial
 
 
-@pytest.fixture
+_MULTIPLICATIVE = Multiplicative()
+
+
+@pytest.fixture(scope='session')
 def multiplicative():
     """Create a multiplicative test quantity."""
-    return Multiplicative()
+    return _MULTIPLICATIVE
 
 
 class Algebraic(Additive, Multiplicative):
     __pow__ = trivial
 
 
-@pytest.fixture
+_ALGEBRAIC = Algebraic()
+
+
+@pytest.fixture(scope='session')
 def algebraic():
     """Create an algebraic test quantity."""
-    return Algebraic()
+    return _ALGEBRAIC
 
 
 class Complex(Algebraic):
@@ -88,10 +106,13 @@ class Complex(Algebraic):
     __neg__ = trivial
 
 
-@pytest.fixture
+_COMPLEX = Complex()
+
+
+@pytest.fixture(scope='session')
 def complex():
     """Create a complex-valued test quantity."""
-    return Complex()
+    return _COMPLEX
 
 
 class Real(Comparable, Complex):
@@ -101,10 +122,13 @@ class Real(Comparable, Complex):
     __rmod__ = trivial
 
 
-@pytest.fixture
+_REAL = Real()
+
+
+@pytest.fixture(scope='session')
 def real():
     """Create a real-valued test quantity."""
-    return Real()
+    return _REAL
 
 
 class Sequence:
@@ -115,10 +139,13 @@ class Sequence:
     __array__ = trivial
 
 
-@pytest.fixture
+_SEQUENCE = Sequence()
+
+
+@pytest.fixture(scope='session')
 def sequence():
     """Create a sequence-like test quantity."""
-    return Sequence()
+    return _SEQUENCE
 
 
 class Array(Sequence):
@@ -133,10 +160,13 @@ class Array(Sequence):
         pass
 
 
-@pytest.fixture
+_ARRAY = Array()
+
+
+@pytest.fixture(scope='session')
 def array():
     """Create an array-like test quantity."""
-    return Array()
+    return _ARRAY
 
 
 class Scalar(Real):
@@ -145,10 +175,13 @@ class Scalar(Real):
     __round__ = trivial
 
 
-@pytest.fixture
+_SCALAR = Scalar()
+
+
+@pytest.fixture(scope='session')
 def scalar():
     """Create a scalar test quantity."""
-    return Scalar()
+    return _SCALAR
 
 
 class Variable(Sequence):
@@ -160,10 +193,13 @@ class Variable(Sequence):
         pass
 
 
-@pytest.fixture
+_VARIABLE = Variable()
+
+
+@pytest.fixture(scope='session')
 def variable():
     """Create a variable test quantity."""
-    return Variable()
+    return _VARIABLE
 
 
 class Measured:
@@ -175,10 +211,13 @@ class Measured:
         pass
 
 
-@pytest.fixture
+_MEASURED = Measured()
+
+
+@pytest.fixture(scope='session')
 def measured():
     """Create a measured test quantity."""
-    return Measured()
+    return _MEASURED
 
 
 class Measurable:
@@ -186,19 +225,25 @@ class Measurable:
         return Measured()
 
 
-@pytest.fixture
+_MEASURABLE = Measurable()
+
+
+@pytest.fixture(scope='session')
 def measurable():
     """Create a measurable test quantity."""
-    return Measurable()
+    return _MEASURABLE
 
 
 class Measurement(Measured, Variable): ...
 
 
-@pytest.fixture
+_MEASUREMENT = Measurement()
+
+
+@pytest.fixture(scope='session')
 def measurement():
     """Create a measurement-like test quantity."""
-    return Measurement()
+    return _MEASUREMENT
 
 
 def test_isordered(ordered, empty):
@@ -1,6 +1,6 @@
-import filecmp
+import contextlib
+import io
 import pathlib
-import subprocess
 import typing
 
 import pytest
@@ -8,6 +8,10 @@ import pytest
 from eprempy import cli
 
 
+_HERE = pathlib.Path(__file__).parent
+"""The directory containing this module and its reference output."""
+
+
 @pytest.fixture
 def argsdict():
     return {
@@ -28,40 +32,28 @@ def argsdict():
 
 def write_files(
     argsdict: typing.Dict[str, dict],
+    directory: pathlib.Path,
 ) -> typing.Tuple[pathlib.Path]:
     """Create temporary config files for testing."""
     written = []
     for key, args in argsdict.items():
-        path = tmpfile(key)
-        with path.open('w') as fp:
-            fp.writelines([f"{k}={v}\n" for k, v in args.items()])
+        path = directory / f"config-{key}.cfg"
+        path.write_text("".join(f"{k}={v}\n" for k, v in args.items()))
         written.append(path)
     return tuple(written)
 
 
-def remove_files(filepaths: typing.Iterable[pathlib.Path]):
-    """Remove temporary config files."""
-    for key in filepaths:
-        tmpfile(key).unlink()
-
-
-def tmpfile(key: str):
-    """Define a temporary file path based on `key`."""
-    return pathlib.Path(f"config-{key}.cfg")
-
-
-def test_diff(argsdict):
+def test_diff(argsdict, tmp_path: pathlib.Path):
     """"""
-    filepaths = write_files(argsdict)
-    pathstr = ' '.join(str(filepath) for filepath in filepaths)
-    command = f"python -m eprempy configfile -c {pathstr} --diff"
-    with pathlib.Path('result-diff.txt').open('w') as fp:
-        subprocess.run(
-            command,
-            stdout=fp,
-            stderr=subprocess.STDOUT,
-            shell=True,
-        )
-    assert filecmp.cmp('expected-diff.txt', 'result-diff.txt')
-    for filepath in filepaths:
-        filepath.unlink()
+    filepaths = write_files(argsdict, tmp_path)
+    options = {
+        'source': None,
+        'files': [str(filepath) for filepath in filepaths],
+        'diff': True,
+        'names': False,
+    }
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        cli.run('configfile', options)
+    expected = (_HERE / 'expected-diff.txt').read_bytes()
+    assert output.getvalue().encode() == expected
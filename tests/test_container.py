@@ -1,3 +1,5 @@
+import itertools
+import re
 import typing
 
 import numpy
@@ -6,24 +8,29 @@ import pytest
 from eprempy import container
 
 
-def test_unique():
+@pytest.mark.parametrize(
+    "items, expected",
+    [
+        ('a', ['a']),
+        ((1, 2), [1, 2]),
+        ('ab', ['a', 'b']),
+        (('a', 'b'), ['a', 'b']),
+        (('a', 'b', 'a'), ['a', 'b']),
+        (('a', 'b', 'a', 'c'), ['a', 'b', 'c']),
+        (('a', 'b', 'b', 'a', 'c'), ['a', 'b', 'c']),
+        ((('a', 'b', 'b', 'a', 'c'),), ['a', 'b', 'c']),
+        (((1,),), [1]),
+        (((1, 2),), [1, 2]),
+        ((('a', 'a'), ('b', 'b')), [('a', 'a'), ('b', 'b')]),
+    ],
+)
+def test_unique(items, expected):
     """Test the function that extracts unique items while preserving order."""
-    cases = {
-        'a': ['a'],
-        (1, 2): [1, 2],
-        'ab': ['a', 'b'],
-        ('a', 'b'): ['a', 'b'],
-        ('a', 'b', 'a'): ['a', 'b'],
-        ('a', 'b', 'a', 'c'): ['a', 'b', 'c'],
-        ('a', 'b', 'b', 'a', 'c'): ['a', 'b', 'c'],
-        (('a', 'b', 'b', 'a', 'c'),): ['a', 'b', 'c'],
-        ((1,),): [1],
-        ((1, 2),): [1, 2],
-        (1, 2): [1, 2],
-        (('a', 'a'), ('b', 'b')): [('a', 'a'), ('b', 'b')],
-    }
-    for items, expected in cases.items():
-        assert list(container.unique(*items)) == expected
+    assert list(container.unique(*items)) == expected
+
+
+def test_unique_errors():
+    """Test the errors raised by `unique`."""
     with pytest.raises(TypeError):
         container.unique(1)
 
@@ -35,21 +42,31 @@ def test_unique_strict():
     assert result == expected
 
 
-def test_unwrap():
+@pytest.mark.parametrize(
+    "case",
+    [[3], (3,), [[3]], [(3,)], ([3],), ((3,),)],
+)
+def test_unwrap(case):
     """Test the function that removes certain outer sequence types."""
-    cases = [[3], (3,), [[3]], [(3,)], ([3],), ((3,),)]
-    for case in cases:
-        assert container.unwrap(case) == 3
-    for case in [[3], [[3]], (3,), [(3,)]]:
-        assert container.unwrap(case, newtype=list) == [3]
-        assert container.unwrap(case, newtype=tuple) == (3,)
-        assert isinstance(
-            container.unwrap(case, newtype=iter),
-            typing.Iterator
-        )
-    for case in [[3, 4], (3, 4), [(3, 4)], ([3, 4])]:
-        assert container.unwrap(case, newtype=list) == [3, 4]
-        assert container.unwrap(case, newtype=tuple) == (3, 4)
+    assert container.unwrap(case) == 3
+
+
+@pytest.mark.parametrize("case", [[3], [[3]], (3,), [(3,)]])
+def test_unwrap_singular(case):
+    """Test `unwrap` with a new type for a single wrapped value."""
+    assert container.unwrap(case, newtype=list) == [3]
+    assert container.unwrap(case, newtype=tuple) == (3,)
+    assert isinstance(
+        container.unwrap(case, newtype=iter),
+        typing.Iterator
+    )
+
+
+@pytest.mark.parametrize("case", [[3, 4], (3, 4), [(3, 4)], ([3, 4])])
+def test_unwrap_multiple(case):
+    """Test `unwrap` with a new type for multiple wrapped values."""
+    assert container.unwrap(case, newtype=list) == [3, 4]
+    assert container.unwrap(case, newtype=tuple) == (3, 4)
 
 
 @pytest.mark.xfail
@@ -68,43 +85,51 @@ def test_isseparable():
         assert not container.isseparable(arg)
 
 
-def test_hastype():
+_INDEX_TYPES = (int, slice, type(...))
+
+
+@pytest.mark.parametrize(
+    "args, kwargs, expected",
+    [
+        # 1) all identical to `isinstance(...)`
+        ((1, int), {}, True),
+        (('s', str), {}, True),
+        (([1, 2], list), {}, True),
+        # 2) targets have declared type and are wrapped in a `list`
+        (([1, 2], int, list), {}, True),
+        # 3) same as case 2, but no declared wrapper
+        (([1, 2], int), {}, False),
+        # 4) same as case 2, but declared wrapper is not `list`
+        (([1, 2], int, tuple), {}, False),
+        # 5) similar to case 2, but one target has undeclared type
+        (([1, 2.0], int, list), {'strict': True}, False),
+        # 6) non-strict versions of 5
+        (([1, 2.0], int, list), {'strict': False}, True),
+        (([1, '2.0'], int, list), {'strict': False}, True),
+        # 7) similar to cases 5 & 6, with consistent types
+        (([1, 2.0], (int, float), list), {'strict': False}, True),
+        (([1, 2.0], (int, float), list), {'strict': True}, True),
+        # 8) variations on case 7 in which `float` is interpreted as a wrapper
+        #    type (may lead to subtle bugs in user code)
+        (([1, 2.0], int, float, list), {'strict': True}, False),
+        (([1, 2.0], int, float, list), {}, True),
+        # *) indices tested in test_variable.py::test_variable_getitem
+        ((slice(None), _INDEX_TYPES, tuple), {'strict': True}, True),
+        ((Ellipsis, _INDEX_TYPES, tuple), {'strict': True}, True),
+        (((0, 0), _INDEX_TYPES, tuple), {'strict': True}, True),
+        (((0, slice(None)), _INDEX_TYPES, tuple), {'strict': True}, True),
+        (((slice(None), 0), _INDEX_TYPES, tuple), {'strict': True}, True),
+        (
+            ((slice(None), slice(0, 1, None)), _INDEX_TYPES, tuple),
+            {'strict': True},
+            True,
+        ),
+        (('hello', _INDEX_TYPES), {'strict': True}, False),
+    ],
+)
+def test_hastype(args, kwargs, expected):
     """Test the function that checks for compound type matches."""
-    # 1) all identical to `isinstance(...)`
-    assert container.hastype(1, int)
-    assert container.hastype('s', str)
-    assert container.hastype([1, 2], list)
-    # 2) targets have declared type and are wrapped in a `list`
-    assert container.hastype([1, 2], int, list)
-    # 3) same as case 2, but no declared wrapper
-    assert not container.hastype([1, 2], int)
-    # 4) same as case 2, but declared wrapper is not `list`
-    assert not container.hastype([1, 2], int, tuple)
-    # 5) similar to case 2, but one target has undeclared type
-    assert not container.hastype([1, 2.0], int, list, strict=True)
-    # 6) non-strict versions of 5
-    assert container.hastype([1, 2.0], int, list, strict=False)
-    assert container.hastype([1, '2.0'], int, list, strict=False)
-    # 7) similar to cases 5 & 6, with consistent types
-    assert container.hastype([1, 2.0], (int, float), list, strict=False)
-    assert container.hastype([1, 2.0], (int, float), list, strict=True)
-    # 8) variations on case 7 in which `float` is interpreted as a wrapper type
-    #    (may lead to subtle bugs in user code)
-    assert not container.hastype([1, 2.0], int, float, list, strict=True)
-    assert container.hastype([1, 2.0], int, float, list)
-    # *) indices tested in test_variable.py::test_variable_getitem
-    indices = [
-        slice(None),
-        Ellipsis,
-        (0, 0),
-        (0, slice(None)),
-        (slice(None), 0),
-        (slice(None), slice(0, 1, None)),
-    ]
-    types = (int, slice, type(...))
-    for index in indices:
-        assert container.hastype(index, types, tuple, strict=True)
-    assert not container.hastype('hello', types, strict=True)
+    assert container.hastype(*args, **kwargs) == expected
 
 
 def test_find_first():
@@ -124,7 +149,7 @@ def test_wrapper():
     values = [1, 2]
     wrapped = container.Wrapper(values)
     assert len(wrapped) == len(values)
-    assert all(value in wrapped for value in values)
+    assert set(values).issubset(wrapped)
     assert list(wrapped) == list(values)
     separables = [
         container.Wrapper(None),
@@ -132,7 +157,7 @@ def test_wrapper():
         container.Wrapper(()),
     ]
     for wrapped in separables:
-        assert len(wrapped) == 0
+        assert not wrapped
         assert not list(wrapped)
     string = '1, 2'
     wrapped = container.Wrapper(string)
@@ -142,7 +167,7 @@ def test_wrapper():
     assert list(wrapped) == [string]
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def standard_entries():
     """A collection of well-behaved entries for a Table instance."""
     return [
@@ -153,7 +178,7 @@ def standard_entries():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def extra_key():
     """A collection of entries in which one has an extra key."""
     return [
@@ -163,9 +188,21 @@ def extra_key():
     ]
 
 
-def test_table_lookup(standard_entries: list):
+@pytest.fixture(scope='module')
+def standard_table(standard_entries: list):
+    """A table of well-behaved entries, shared by tests that only read it."""
+    return container.Table(standard_entries)
+
+
+@pytest.fixture(scope='module')
+def extra_table(extra_key: list):
+    """A table in which one entry has an extra key, shared by tests."""
+    return container.Table(extra_key)
+
+
+def test_table_lookup(standard_table: container.Table):
     """Test the object that supports multi-key look-up."""
-    table = container.Table(standard_entries)
+    table = standard_table
     gary = table(name='Gary')
     assert gary['nickname'] == 'Gare-bear'
     assert gary['species'] == 'cat'
@@ -184,102 +221,109 @@ def test_table_lookup(standard_entries: list):
         table(nickname='Yrag', species='dog', name='Gary', strict=True)
 
 
+# Precompiled patterns for `Table` error messages.
+_MSG_NO_COMMON_KEY = re.compile(re.escape(
+    "Table has no common key 'example'"
+))
+_MSG_NO_DOG_GARY = re.compile(re.escape(
+    "Table has no entry with species=dog and name=Gary"
+))
+_MSG_NO_CAT_GARY = re.compile(re.escape(
+    "Table has no entry with"
+    " nickname=Yrag, species=cat, and name=Gary"
+))
+_MSG_NO_SIMONE = re.compile(re.escape(
+    "Table has no entry with name=Simone"
+))
+_MSG_AMBIGUOUS = re.compile(re.escape(
+    "The search criterion 'species=cat' is ambiguous"
+))
+
+
 def test_table_errors(
-    standard_entries: list,
-    extra_key: list,
+    standard_table: container.Table,
+    extra_table: container.Table,
 ) -> None:
     """Regression test for `Table` error messages.
 
     This is separate from other tests in case we want to assert that `Table`
     raised a particular exception but we don't care what the actual message is.
     """
-    standard = container.Table(standard_entries)
-    extra = container.Table(extra_key)
+    standard = standard_table
+    extra = extra_table
 
-    message = "Table has no common key 'example'"
+    message = _MSG_NO_COMMON_KEY
     with pytest.raises(container.TableKeyError, match=message):
         standard(example='bird')
     with pytest.raises(container.TableKeyError, match=message):
         standard(example='bird', strict=True)
     with pytest.raises(container.TableKeyError, match=message):
         extra(example='car')
-    message = "Table has no entry with species=dog and name=Gary"
-    with pytest.raises(container.TableLookupError, match=message):
+    with pytest.raises(container.TableLookupError, match=_MSG_NO_DOG_GARY):
         standard(species='dog', name='Gary', strict=True)
-    message = (
-        "Table has no entry with"
-        " nickname=Yrag, species=cat, and name=Gary"
-    )
-    with pytest.raises(container.TableLookupError, match=message):
+    with pytest.raises(container.TableLookupError, match=_MSG_NO_CAT_GARY):
         standard(nickname='Yrag', species='cat', name='Gary', strict=True)
-    message = "Table has no entry with name=Simone"
-    with pytest.raises(container.TableLookupError, match=message):
+    with pytest.raises(container.TableLookupError, match=_MSG_NO_SIMONE):
         standard(name='Simone')
-    message = "The search criterion 'species=cat' is ambiguous"
-    with pytest.raises(container.AmbiguousRequestError, match=message):
+    with pytest.raises(container.AmbiguousRequestError, match=_MSG_AMBIGUOUS):
         standard(species='cat')
 
 
-def test_table_modes(standard_entries: list):
+_GARY = {'name': 'Gary', 'nickname': 'Gare-bear', 'species': 'cat'}
+_RAMON = {'name': 'Ramon', 'nickname': 'Ro-ro', 'species': 'dog'}
+
+
+@pytest.mark.parametrize(
+    "keys",
+    list(itertools.permutations(_GARY)),
+    ids='-'.join,
+)
+def test_table_modes(standard_table: container.Table, keys: tuple):
     """Test the search modes available to Table."""
-    def permute(d: dict, n: int=0) -> dict:
-        """Permute the dict by `n` (anti-cyclic for n < 0)."""
-        if n == 0:
-            return d
-        keys = list(d.keys())
-        if n < 0:
-            l = len(keys)
-            perm = keys[l+n::-1] + keys[:l+n:-1]
-        else:
-            perm = keys[n:] + keys[:n]
-        return {k: d[k] for k in perm}
-
-    table = container.Table(standard_entries)
-    valid = {'name': 'Gary', 'nickname': 'Gare-bear', 'species': 'cat'}
-    permutations = []
-    length = len(valid)
-    for n in range(length):
-        permutations.extend([permute(valid, n), permute(valid, n-length)])
-    for request in permutations:
-        entry = table(**request)
-        assert entry['name'] == 'Gary'
-        assert entry['nickname'] == 'Gare-bear'
-        assert entry['species'] == 'cat'
-    for request in permutations[:4]:
-        entry = table(**{**request, **{'species': 'dog'}})
-        assert entry['name'] == 'Gary'
-        assert entry['nickname'] == 'Gare-bear'
-        assert entry['species'] == 'cat'
-    for request in permutations[4:]:
-        entry = table(**{**request, **{'species': 'dog'}})
-        assert entry['name'] == 'Ramon'
-        assert entry['nickname'] == 'Ro-ro'
-        assert entry['species'] == 'dog'
+    request = {k: _GARY[k] for k in keys}
+    entry = standard_table(**request)
+    for key, value in _GARY.items():
+        assert entry[key] == value
+    # When the criteria conflict, the first one determines the entry. Only
+    # orderings that lead with 'species' find the dog.
+    expected = _RAMON if keys[0] == 'species' else _GARY
+    entry = standard_table(**{**request, **{'species': 'dog'}})
+    for key, value in expected.items():
+        assert entry[key] == value
+
+
+def test_table_modes_strict(standard_table: container.Table):
+    """Conflicting criteria are an error in strict mode."""
     with pytest.raises(container.TableLookupError):
-        table(name='Gary', nickname='Gare-bear', species='dog', strict=True)
+        standard_table(
+            name='Gary',
+            nickname='Gare-bear',
+            species='dog',
+            strict=True,
+        )
 
 
-def test_table_getitem(extra_key: list):
+def test_table_getitem(extra_key: list, extra_table: container.Table):
     """Make sure we can get values of a common key via [] syntax."""
-    table = container.Table(extra_key)
+    table = extra_table
     subset = [entry['lower'] for entry in extra_key]
     assert table['lower'] == tuple(subset)
     with pytest.raises(container.TableKeyError):
         table['example']
 
 
-def test_table_get(extra_key: list):
+def test_table_get(extra_key: list, extra_table: container.Table):
     """Make sure we can get value of any key, or a default value."""
-    table = container.Table(extra_key)
+    table = extra_table
     subset = [entry.get('example') for entry in extra_key]
     assert table.get('example') == tuple(subset)
     subset = [entry.get('example', -1) for entry in extra_key]
     assert table.get('example', -1) == tuple(subset)
 
 
-def test_table_find(standard_entries: list):
+def test_table_find(standard_table: container.Table):
     """Test table look-up by value."""
-    table = container.Table(standard_entries)
+    table = standard_table
     expected = {'name': 'Pickles', 'nickname': 'Pick', 'species': 'cat'}
     assert table.find('Pickles') == [expected]
     assert table.find('Pickles', unique=True) == expected
@@ -373,33 +417,74 @@ def test_object_registry():
     assert sorted(registry) == sorted(['this', 'func'])
 
 
-def test_nearest():
-    values = [0.1, 0.2, 0.3]
-    basic = {
-        0.11: (0, 0.1),
-        0.15: (0, 0.1),
-        0.20: (1, 0.2),
-    }
-    for target, (index, value) in basic.items():
-        found = container.nearest(values, target)
-        assert found.index == index
-        assert found.value == value
-    for target in [0.21, 0.25, 0.29]:
-        found = container.nearest(values, target, bound='lower')
-        assert found.index == 2
-        assert found.value == 0.3
-        found = container.nearest(values, target, bound='upper')
-        assert found.index == 1
-        assert found.value == 0.2
-    values = numpy.arange(3.0 * 4.0 * 5.0).reshape(3, 4, 5)
-    found = container.nearest(values, 32.9)
+def test_graph():
+    """Test the collection of weighted edges."""
+    graph = container.Graph({('a', 'b'): 2.0, ('b', 'c'): 4.0})
+    assert len(graph) == 4
+    assert ('b', 'a') in graph
+    assert ('a', 'c') not in graph
+    assert set(graph.nodes) == {'a', 'b', 'c'}
+    assert graph.get_adjacencies('b') == {'a': 0.5, 'c': 4.0}
+    assert graph.get_adjacencies('d') == {}
+    graph.get_adjacencies('a')['d'] = 1.0
+    assert 'd' not in graph.nodes
+    graph.add_connection('c', 'd', 0.25)
+    assert graph.get_adjacencies('d') == {'c': 4.0}
+    assert graph.get_weight('c', 'd') == 0.25
+    with pytest.raises(KeyError):
+        graph.get_weight('a', 'd')
+
+
+_NEAREST_VALUES = (0.1, 0.2, 0.3)
+"""Values for the 1-D `container.nearest` tests."""
+
+
+@pytest.fixture(scope='module')
+def nearest_grid():
+    """A 3-D array for testing `container.nearest`."""
+    return numpy.arange(3.0 * 4.0 * 5.0).reshape(3, 4, 5)
+
+
+@pytest.mark.parametrize(
+    "target, index, value",
+    [
+        (0.11, 0, 0.1),
+        (0.15, 0, 0.1),
+        (0.20, 1, 0.2),
+    ],
+)
+def test_nearest(target, index, value):
+    """Find the nearest value without a bound."""
+    found = container.nearest(_NEAREST_VALUES, target)
+    assert found.index == index
+    assert found.value == value
+
+
+@pytest.mark.parametrize("target", [0.21, 0.25, 0.29])
+@pytest.mark.parametrize(
+    "bound, index, value",
+    [
+        ('lower', 2, 0.3),
+        ('upper', 1, 0.2),
+    ],
+)
+def test_nearest_bound(target, bound, index, value):
+    """Find the nearest value subject to a bound."""
+    found = container.nearest(_NEAREST_VALUES, target, bound=bound)
+    assert found.index == index
+    assert found.value == value
+
+
+def test_nearest_array(nearest_grid):
+    """Find the nearest value in a multi-dimensional array."""
+    found = container.nearest(nearest_grid, 32.9)
     assert found.index == (1, 2, 3)
     assert found.value == 33.0
 
 
-def test_merge():
-    """Test the order-preserving merge function."""
-    valid = [
+@pytest.mark.parametrize(
+    "these, those, expected",
+    [
         [['a', 'b'], ['x', 'y'], ['a', 'b', 'x', 'y']],
         [['x', 'y', 'z'], ['x', 'y', 'z'], ['x', 'y', 'z']],
         [['x', 'y', 'z'], ['x', 'y'], ['x', 'y', 'z']],
@@ -423,27 +508,45 @@ def test_merge():
             ['a', 'x', 'b', 't', 'y', 'c', 'z'],
             ['a', 'q', 'x', 'q', 'p', 'b', 't', 'y', 'c', 'r', 'z'],
         ],
-    ]
-    for these, those, expected in valid:
-        assert container.merge(these, those) == expected
-    invalid = [
+    ],
+)
+def test_merge(these, those, expected):
+    """Test the order-preserving merge function."""
+    assert container.merge(these, those) == expected
+
+
+@pytest.mark.parametrize(
+    "these, those",
+    [
         [['a', 'b', 'c'], ['a', 'c', 'b']],
         [['a', 'c', 'b'], ['a', 'b', 'c']],
-    ]
-    for these, those in invalid:
-        with pytest.raises(container.MergeError):
-            container.merge(these, those)
+    ],
+)
+def test_merge_errors(these, those):
+    """Test the errors raised by the order-preserving merge function."""
+    with pytest.raises(container.MergeError):
+        container.merge(these, those)
 
 
-def test_isiterable():
-    """Test the function that checks for iterable input."""
-    class Iterable:
-        def __iter__(self):
-            yield from ()
-    class NotIterable:
-        def __iter__(self):
-            raise TypeError
-    cases = [
+class _Iterable:
+    """An iterable object with no members."""
+    def __iter__(self):
+        yield from ()
+    def __repr__(self):
+        return 'Iterable()'
+
+
+class _NotIterable:
+    """An object that defines `__iter__` but refuses to iterate."""
+    def __iter__(self):
+        raise TypeError
+    def __repr__(self):
+        return 'NotIterable()'
+
+
+@pytest.mark.parametrize(
+    "x, truth",
+    [
         (1, False),
         ('1', True),
         ([1], True),
@@ -453,27 +556,34 @@ def test_isiterable():
         ({}, True),
         (set(), True),
         (None, False),
-        (Iterable(), True),
-        (NotIterable(), False),
-    ]
-    for (x, truth) in cases:
-        assert container.isiterable(x) == truth
-    # NOTE: These are intended to ensure that calling `isiterable(arg)` doesn't
-    # modify `arg` (e.g., by exhausting an iterator).
-    x = [1, 2]
+        (_Iterable(), True),
+        (_NotIterable(), False),
+    ],
+    ids=repr,
+)
+def test_isiterable(x, truth):
+    """Test the function that checks for iterable input."""
+    assert container.isiterable(x) == truth
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [list, iter, lambda x: (i for i in x)],
+    ids=['list', 'iterator', 'generator'],
+)
+def test_isiterable_preserves(factory):
+    """Calling `isiterable(arg)` must not modify `arg`.
+
+    For example, it must not exhaust an iterator.
+    """
+    x = factory([1, 2])
     container.isiterable(x)
-    assert x == [1, 2]
-    y = iter(x)
-    container.isiterable(y)
-    assert list(y) == [1, 2]
-    z = (i for i in x)
-    container.isiterable(z)
-    assert list(z) == [1, 2]
+    assert list(x) == [1, 2]
 
 
-def test_size():
-    """Test the function that computes the size of a nested collection."""
-    valid = [
+@pytest.mark.parametrize(
+    "x, n",
+    [
         ([], 0),
         ([1], 1),
         ([1, 2], 2),
@@ -481,33 +591,45 @@ def test_size():
         ([[1, 2], [3, 4]], 4),
         ([1, 2, 3, 4], 4),
         ([[1, 2, 3, 4]], 4),
-    ]
-    for (x, n) in valid:
-        assert container.size(x) == n
-    error = [
-        1,
-        None,
-        '1',
-        '[1]',
-    ]
-    for x in error:
-        with pytest.raises(TypeError):
-            container.size(x)
+    ],
+    ids=repr,
+)
+def test_size(x, n):
+    """Test the function that computes the size of a nested collection."""
+    assert container.size(x) == n
 
 
-def test_slice2range():
+@pytest.mark.parametrize("x", [1, None, '1', '[1]'], ids=repr)
+def test_size_errors(x):
+    """Test the errors raised when computing the size of a collection."""
+    with pytest.raises(TypeError):
+        container.size(x)
+
+
+@pytest.mark.parametrize(
+    "s, kwargs, expected",
+    [
+        (slice(3), {}, range(0, 3, 1)),
+        (slice(3, 9), {}, range(3, 9, 1)),
+        (slice(3, 9, 2), {}, range(3, 9, 2)),
+        (slice(None), {'stop': 4}, range(4)),
+    ],
+    ids=repr,
+)
+def test_slice2range(s, kwargs, expected):
     """Test the function that converts a slice to a range."""
-    assert container.slice2range(slice(3)) == range(0, 3, 1)
-    assert container.slice2range(slice(3, 9)) == range(3, 9, 1)
-    assert container.slice2range(slice(3, 9, 2)) == range(3, 9, 2)
-    assert container.slice2range(slice(None), stop=4) == range(4)
+    assert container.slice2range(s, **kwargs) == expected
+
+
+def test_slice2range_errors():
+    """A slice without a stop value requires an explicit stop."""
     with pytest.raises(TypeError):
         container.slice2range(slice(None))
 
 
-def test_isshapelike():
-    """Test the function that checks for potential array shapes."""
-    valid = [
+@pytest.mark.parametrize(
+    "arg, truth",
+    [
         ([0, 1, 2, 3], True),
         ((0, 1, 2, 3), True),
         (range(4), True),
@@ -515,6 +637,9 @@ def test_isshapelike():
         ((), False),
         (None, False),
         ('shape', False),
-    ]
-    for arg, truth in valid:
-        assert container.isshapelike(arg) == truth
+    ],
+    ids=repr,
+)
+def test_isshapelike(arg, truth):
+    """Test the function that checks for potential array shapes."""
+    assert container.isshapelike(arg) == truth
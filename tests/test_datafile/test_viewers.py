@@ -2,39 +2,43 @@ import pathlib
 import typing
 
 import numpy
+import pytest
 
 from eprempy import datafile
 
 
-def test_view_factory(
+@pytest.fixture(scope='module')
+def view(
+    request: pytest.FixtureRequest,
     datadir: pathlib.Path,
     datasets: typing.Dict[str, typing.Dict[str, str]],
-) -> None:
+    datafile_view: typing.Callable[[pathlib.Path], datafile.View],
+) -> datafile.View:
+    """The view of the dataset named by the indirect parameter."""
+    rundir = request.param
+    return datafile_view(datadir / rundir / datasets[rundir]['source'])
+
+
+@pytest.mark.parametrize(
+    "view, arrays",
+    [
+        ('isotropic-shock-with-dist', frozenset(datafile.ARRAYS) - {'flux'}),
+        ('isotropic-shock-with-flux', frozenset(datafile.ARRAYS) - {'Dist'}),
+    ],
+    indirect=['view'],
+    ids=['dist', 'flux'],
+)
+def test_view_factory(view: datafile.View, arrays: typing.FrozenSet[str]):
     """Test the ability to create format-agnostic views of a dataset."""
-    cases = {
-        'isotropic-shock-with-dist': {
-            'arrays': set(datafile.ARRAYS) - {'flux'},
-            'scalars': datafile.SCALARS,
-            'axes': datafile.AXES,
-        },
-        'isotropic-shock-with-flux': {
-            'arrays': set(datafile.ARRAYS) - {'Dist'},
-            'scalars': datafile.SCALARS,
-            'axes': datafile.AXES,
-        },
-    }
-    for rundir, these in cases.items():
-        data = datasets[rundir]
-        current = datafile.view(datadir / rundir / data['source'])
-        for name in these['arrays']:
-            assert name in current.arrays
-        for name in these['scalars']:
-            assert name in current.scalars
-        for name in these['axes']:
-            assert name in current.axes
-
-
-def test_egrid_shape(datadir: pathlib.Path):
+    assert arrays <= view.arrays.keys()
+    assert frozenset(datafile.SCALARS) <= view.scalars.keys()
+    assert frozenset(datafile.AXES) <= view.axes.keys()
+
+
+def test_egrid_shape(
+    datadir: pathlib.Path,
+    datafile_view: typing.Callable[[pathlib.Path], datafile.View],
+) -> None:
     """Test the ability to detect 1D or 2D `egrid` in the dataset.
 
     This test exists because we changed `egrid` to be 1D (indexed only by
@@ -42,10 +46,10 @@ def test_egrid_shape(datadir: pathlib.Path):
     species and energy) but the energy dimension was always singular, making it
     effectively 1D.
     """
-    old = datafile.view(datadir / 'misc' / 'egrid-2d.nc')
-    new = datafile.view(datadir / 'misc' / 'egrid-1d.nc')
+    old = datafile_view(datadir / 'misc' / 'egrid-2d.nc')
+    new = datafile_view(datadir / 'misc' / 'egrid-1d.nc')
     assert old.axes['energy'].size == new.axes['energy'].size
     for current, ndim in zip((old, new), (2, 1)):
-        assert numpy.array(current.arrays['egrid'].data).ndim == ndim
+        assert numpy.ndim(current.arrays['egrid'].data) == ndim
 
 
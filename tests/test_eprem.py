@@ -2,6 +2,8 @@
 Tests of the top-level API.
 """
 
+import functools
+import operator
 import pathlib
 import typing
 
@@ -29,41 +31,76 @@ UNOBSERVABLE = {'shell', 'shells', 'phiOffset'}
 """Quantities that tests should not try to observe."""
 
 
-@pytest.fixture
-def streams(datadir: pathlib.Path) -> typing.Dict[str, eprem.Stream]:
+_ARRAY_NAMES = frozenset(reference.ARRAYS.names) - UNOBSERVABLE
+"""Names of array quantities that tests should observe."""
+
+
+_OBSERVABLE_ALIASES = {
+    name: tuple(reference.OBSERVABLES.aliases[name])
+    for name in reference.OBSERVABLES.names.values(aliased=True)
+    if name not in UNOBSERVABLE
+}
+"""Aliases of each observable quantity that tests should observe."""
+
+
+@functools.lru_cache(maxsize=None)
+def _stream(n: int, source: pathlib.Path) -> eprem.Stream:
+    """Create each stream-observer interface once per session."""
+    return eprem.stream(n, 'eprem.cfg', source)
+
+
+@functools.lru_cache(maxsize=None)
+def _point(name: str, source: pathlib.Path) -> eprem.Point:
+    """Create each point-observer interface once per session."""
+    return eprem.point(name, 'eprem.cfg', source)
+
+
+@functools.lru_cache(maxsize=None)
+def _dataset(source: pathlib.Path, system: str) -> eprem.Dataset:
+    """Create each dataset interface once per session."""
+    return eprem.dataset(source, config='eprem.cfg', system=system)
+
+
+@pytest.fixture(scope='session')
+def streams(
+    dist_source: pathlib.Path,
+    flux_source: pathlib.Path,
+) -> typing.Dict[pathlib.Path, eprem.Stream]:
     """A collection of testable stream-observer interfaces."""
-    basedirs = {'isotropic-shock-with-dist', 'isotropic-shock-with-flux'}
-    observers = {}
-    for basedir in basedirs:
-        source = datadir / basedir
-        observers[source] = eprem.stream(0, 'eprem.cfg', source)
-    return observers
+    return {
+        source: _stream(0, source)
+        for source in (dist_source, flux_source)
+    }
+
 
+@pytest.fixture(scope='session')
+def flux_stream(flux_source: pathlib.Path) -> eprem.Stream:
+    """The first stream observer of the flux dataset."""
+    return _stream(0, flux_source)
 
-@pytest.fixture
-def points(datadir: pathlib.Path) -> typing.Dict[str, eprem.Stream]:
+
+@pytest.fixture(scope='session')
+def points(
+    dist_source: pathlib.Path,
+    flux_source: pathlib.Path,
+) -> typing.Dict[pathlib.Path, eprem.Point]:
     """A collection of testable point-observer interfaces."""
-    basedirs = {'isotropic-shock-with-dist', 'isotropic-shock-with-flux'}
-    observers = {}
-    for basedir in basedirs:
-        source = datadir / basedir
-        observers[source] = eprem.point('000', 'eprem.cfg', source)
-    return observers
+    return {
+        source: _point('000', source)
+        for source in (dist_source, flux_source)
+    }
 
 
 def test_observer_mapping(streams: typing.Dict[str, eprem.Stream]):
     """Test the ability to access observable quantities."""
-    names = set(reference.ARRAYS.names) - UNOBSERVABLE
     for stream in streams.values():
-        for name in names:
+        for name in _ARRAY_NAMES:
             assert isinstance(stream[name], Observable)
-    observables = reference.OBSERVABLES.names.values(aliased=True)
-    names = set(observables) - UNOBSERVABLE
     for stream in streams.values():
-        for name in names:
-            aliases = reference.OBSERVABLES.aliases[name]
+        for name, aliases in _OBSERVABLE_ALIASES.items():
+            target = stream[name]
             for alias in aliases:
-                assert stream[name] == stream[alias]
+                assert stream[alias] == target
 
 
 def test_observer_axes(streams: typing.Dict[str, eprem.Stream]):
@@ -82,43 +119,41 @@ def test_observer_axes(streams: typing.Dict[str, eprem.Stream]):
         assert numpy.array_equal(stream.mus.data, stream['mu'])
 
 
-def test_observer_hash(datadir: pathlib.Path):
+def test_observer_hash(dist_source: pathlib.Path, flux_source: pathlib.Path):
     """Test the ability to hash an observer."""
-    basedirs = {'isotropic-shock-with-dist', 'isotropic-shock-with-flux'}
-    for basedir in basedirs:
-        source = datadir / basedir
+    for source in (dist_source, flux_source):
         for n in (0, 4):
-            stream = eprem.stream(n, 'eprem.cfg', source)
-            assert hash(stream)
+            assert hash(_stream(n, source))
 
 
 def test_create_dataset(datadir: pathlib.Path, datasets: dict):
     """Create an interface to a complete dataset."""
-    observables = reference.OBSERVABLES.names.values(aliased=True)
-    names = set(observables) - UNOBSERVABLE
     for filename in datasets:
+        source = datadir / filename
         for system in ('mks', 'cgs'):
-            source = datadir / filename
-            dataset = eprem.dataset(source, config='eprem.cfg', system=system)
+            dataset = _dataset(source, system)
             assert isinstance(dataset, eprem.Dataset)
             assert dataset.directory == source
             assert dataset.system == system
-            for observer in dataset.observers.values():
-                for name in names:
-                    aliases = reference.OBSERVABLES.aliases[name]
-                    for alias in aliases:
-                        assert observer[name] == observer[alias]
             for stream in dataset.streams.values():
                 assert isinstance(stream, eprem.Stream)
             for point in dataset.points.values():
                 assert isinstance(point, eprem.Point)
+            check_aliases(dataset)
+
+
+def check_aliases(dataset: eprem.Dataset) -> None:
+    """Helper for `test_create_dataset`."""
+    for observer in dataset.observers.values():
+        for name, aliases in _OBSERVABLE_ALIASES.items():
+            target = observer[name]
+            for alias in aliases:
+                assert observer[alias] == target
 
 
-def test_symbolic_species(datadir: pathlib.Path):
+def test_symbolic_species(flux_stream: eprem.Stream):
     """Subscript the species axis with a valid chemical symbol."""
-    source = datadir / 'isotropic-shock-with-flux'
-    config = 'eprem.cfg'
-    stream = eprem.stream(0, config, source)
+    stream = flux_stream
     flux = stream['flux'][0, 0, 'H+', 0]
     assert isinstance(flux, Array)
     with pytest.raises(ValueError):
@@ -147,11 +182,9 @@ def test_subscript_coordinate(streams: typing.Dict[str, eprem.Stream]):
                 assert numpy.array_equal(speed, v)
 
 
-def test_observable_array(datadir: pathlib.Path):
+def test_observable_array(flux_stream: eprem.Stream):
     """Directly convert an observable quantity into an array."""
-    source = datadir / 'isotropic-shock-with-flux'
-    config = 'eprem.cfg'
-    stream = eprem.stream(0, config, source)
+    stream = flux_stream
     mfp = stream['mfp']
     ndarray = numpy.array(mfp)
     assert isinstance(ndarray, numpy.ndarray)
@@ -160,11 +193,9 @@ def test_observable_array(datadir: pathlib.Path):
     assert ndarray.shape == array.shape
 
 
-def test_observable_algebra(datadir: pathlib.Path):
+def test_observable_algebra(flux_stream: eprem.Stream):
     """Algebraically create an observable quantity."""
-    source = datadir / 'isotropic-shock-with-flux'
-    config = 'eprem.cfg'
-    stream = eprem.stream(0, config, source)
+    stream = flux_stream
     mfp = stream['mfp']
     mfp_sqr = mfp ** 2
     assert isinstance(mfp_sqr, Observable)
@@ -179,10 +210,9 @@ def test_observable_algebra(datadir: pathlib.Path):
     assert isinstance(mfpxur, Observable)
     assert mfpxur.unit == mfp.unit * ur.unit
     assert mfpxur.dimensions == mfp.dimensions | ur.dimensions
-    with pytest.raises(ValueError):
-        mfp + ur
-    with pytest.raises(ValueError):
-        mfp - ur
+    for op in (operator.add, operator.sub):
+        with pytest.raises(ValueError, match='unequal values of'):
+            op(mfp, ur)
     utheta = stream['utheta']
     utheta_plus_ur = utheta + ur
     assert isinstance(utheta_plus_ur, Observable)
@@ -199,11 +229,9 @@ def test_observable_algebra(datadir: pathlib.Path):
     assert combined.dimensions == mfp.dimensions | ur_utheta.dimensions
 
 
-def test_symbolic_observable(datadir: pathlib.Path):
+def test_symbolic_observable(flux_stream: eprem.Stream):
     """Symbolically create an observable quantity."""
-    source = datadir / 'isotropic-shock-with-flux'
-    config = 'eprem.cfg'
-    stream = eprem.stream(0, config, source)
+    stream = flux_stream
     mfp = stream['mfp']
     mfp_sqr = stream['mfp**2']
     assert isinstance(mfp_sqr, Observable)
@@ -222,35 +250,35 @@ def test_symbolic_observable(datadir: pathlib.Path):
         stream['mfp / lambda0']
 
 
-def test_radial_interpolation(datadir: pathlib.Path) -> None:
+@pytest.mark.parametrize(
+    "index, dimensions",
+    [
+        (40, ('time', 'shell', 'species', 'minimum energy')),
+        ((1.0, 'au'), ('time', 'radius', 'species', 'minimum energy')),
+        ((1.5e11, 'm'), ('time', 'radius', 'species', 'minimum energy')),
+    ],
+)
+def test_radial_interpolation(
+    flux_stream: eprem.Stream,
+    index,
+    dimensions: typing.Tuple[str, ...],
+) -> None:
     """Interpolate integral flux to radial values."""
-    source = datadir / 'isotropic-shock-with-flux'
-    config = 'eprem.cfg'
-    stream = eprem.stream(0, config, source)
-    indices = (40, (1.0, 'au'), (1.5e11, 'm'))
-    shape = (50, 1, 1, 1)
-    unit = 'cm^-2 s^-1 sr^-1'
     minenergy = (10.0, 'MeV')
-    for index in indices:
-        if isinstance(index, int):
-            dimensions = ('time', 'shell', 'species', 'minimum energy')
-        else:
-            dimensions = ('time', 'radius', 'species', 'minimum energy')
-        observed = stream['integral flux'][:, index, 'H+', minenergy]
-        converted = observed.withunit(unit)
-        assert converted.shape == shape
-        assert converted.dimensions == dimensions
-        assert converted.unit == unit
+    unit = 'cm^-2 s^-1 sr^-1'
+    observed = flux_stream['integral flux'][:, index, 'H+', minenergy]
+    converted = observed.withunit(unit)
+    assert converted.shape == (50, 1, 1, 1)
+    assert converted.dimensions == dimensions
+    assert converted.unit == unit
 
 
 def test_point_coordinates(
-    datadir: pathlib.Path,
-    points: typing.Dict[str, eprem.Point],
+    points: typing.Dict[pathlib.Path, eprem.Point],
 ) -> None:
     """Make sure a point observer knows its coordinates."""
-    for runname, point in points.items():
-        source = datadir / runname
-        dataset = eprem.dataset(source, config='eprem.cfg')
+    for source, point in points.items():
+        dataset = _dataset(source, 'mks')
         assert point.r.unit == 'm'
         r0 = dataset.parameters['obsR'][0]
         assert float(point.r.withunit(r0.unit)) == pytest.approx(float(r0))
@@ -99,8 +99,8 @@ def test_nothing():
     assert etc.Nothing['at all'] is None
     assert etc.Nothing(to_see='here') is None
     assert 'something' not in etc.Nothing
-    for _ in etc.Nothing:
-        assert False
+    missing = object()
+    assert next(iter(etc.Nothing), missing) is missing
     with pytest.raises(StopIteration):
         next(etc.Nothing)
     this = etc.NothingType()
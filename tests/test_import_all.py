@@ -2,27 +2,36 @@
 This module exists to make sure each `__all__` is up to date.
 """
 
-from eprempy.base import *
-from eprempy.datafile import *
-from eprempy.measurable import *
-from eprempy.measured import *
-from eprempy.metric import *
-from eprempy.numeric import *
-from eprempy.observable import *
-from eprempy.parameter import *
-from eprempy.physical import *
-from eprempy.quantity import *
-from eprempy.real import *
-from eprempy.symbolic import *
+import importlib
 
+import pytest
 
-def test_true():
-    """Unconditionally succeed.
-
-    This "test" is a placeholder. If any of the attempts to `import *` fail,
-    this test will never run. If they all succeed, this test will cause the test
-    runner to indicate that the entire module succeeded.
-    """
-    assert True
 
+@pytest.mark.parametrize(
+    "name",
+    [
+        'base',
+        'datafile',
+        'measurable',
+        'measured',
+        'metric',
+        'numeric',
+        'observable',
+        'parameter',
+        'physical',
+        'quantity',
+        'real',
+        'symbolic',
+    ],
+)
+def test_all(name: str):
+    """Every name in a module's `__all__` must exist in that module.
 
+    This is the condition under which `from <module> import *` succeeds, but it
+    does not copy every public name into this module's namespace.
+    """
+    module = importlib.import_module(f'eprempy.{name}')
+    # A module without `__all__` exports its public names, which always exist.
+    names = getattr(module, '__all__', ())
+    missing = [n for n in names if not hasattr(module, n)]
+    assert not missing, missing
@@ -9,58 +9,42 @@ import pytest
 from eprempy import measured
 
 
-def test_factory():
+_VALUE = 1.5
+"""A measurable value for factory tests."""
+
+_VALUES = [_VALUE, 2*_VALUE]
+"""Measurable values for factory tests."""
+
+_UNIT = 'm'
+"""The metric unit for factory tests."""
+
+
+@pytest.mark.parametrize("arg", [_VALUES, [_VALUES]])
+def test_factory(arg):
     """Test the ability to create a measured sequence."""
-    value = 1.5
-    unit = 'm'
-    values = [value, 2*value]
-    for arg in (values, [values]):
-        sequence = measured.sequence(arg, unit)
-        copied = measured.sequence(sequence)
-        assert copied is not sequence
-        assert copied == sequence
-    valid = [
-        (
-            [value, unit],
-            measured.sequence([value], unit),
-        ),
-        (
-            [measured.value(value, unit)],
-            measured.sequence([value], unit),
-        ),
-        (
-            [numpy.array([value]), unit],
-            measured.sequence([value], unit),
-        ),
-        (
-            [numpy.array([values]), unit],
-            measured.sequence(values, unit),
-        ),
-        (
-            [numpy.array([values, values]), unit],
-            measured.sequence([values, values], unit)
-        ),
-        (
-            [measured.sequence(numpy.array([value]), unit)],
-            measured.sequence([value], unit),
-        ),
-        (
-            [values, unit],
-            measured.sequence(values, unit),
-        ),
-        (
-            [values, unit],
-            measured.sequence(values, unit),
-        ),
-        (
-            [measured.value(value, unit)],
-            measured.sequence([value], unit),
-        ),
-    ]
-    for (args, expected) in valid:
-        assert measured.sequence(*args) == expected
+    sequence = measured.sequence(arg, _UNIT)
+    copied = measured.sequence(sequence)
+    assert copied is not sequence
+    assert copied == sequence
     with pytest.raises(ValueError):
-        measured.sequence(sequence, unit=unit)
+        measured.sequence(sequence, unit=_UNIT)
+
+
+@pytest.mark.parametrize(
+    "args, data",
+    [
+        ([_VALUE, _UNIT], [_VALUE]),
+        ([measured.value(_VALUE, _UNIT)], [_VALUE]),
+        ([numpy.array([_VALUE]), _UNIT], [_VALUE]),
+        ([numpy.array([_VALUES]), _UNIT], _VALUES),
+        ([numpy.array([_VALUES, _VALUES]), _UNIT], [_VALUES, _VALUES]),
+        ([measured.sequence(numpy.array([_VALUE]), _UNIT)], [_VALUE]),
+        ([_VALUES, _UNIT], _VALUES),
+    ],
+)
+def test_factory_valid(args, data):
+    """Test valid arguments to the measured-sequence factory."""
+    assert measured.sequence(*args) == measured.sequence(data, _UNIT)
 
 
 def test_subscription():
@@ -9,37 +9,54 @@ import pytest
 from eprempy import measured
 
 
+_VALUE = 1.5
+"""A measurable value for factory tests."""
+
+_UNIT = 'm'
+"""The metric unit for factory tests."""
+
+
 def test_factory():
     """Test the ability to create a measured value."""
-    value = 1.5
-    unit = 'm'
-    original = measured.value(value, unit=unit)
+    original = measured.value(_VALUE, unit=_UNIT)
     copied = measured.value(original)
     assert copied is not original
     assert copied == original
-    valid = [
-        [value, unit],
-        [measured.sequence([value], unit)],
-        [measured.sequence([[value]], unit)],
-        [numpy.array([[value]]), unit],
-        [[value], unit],
-        [[[value]], unit],
-    ]
-    for args in valid:
-        assert measured.value(*args) == original
-    error = [
-        measured.sequence([value, 2*value]),
-        measured.sequence([[value, 2*value]]),
-        numpy.array([[value, 2*value]]),
-        [[value, 2*value]],
-        str(value),
-        [str(value)],
-        [[str(value)]],
-    ]
-    for arg in error:
-        with pytest.raises(TypeError):
-            measured.value(arg)
     with pytest.raises(ValueError):
-        measured.value(original, unit=unit)
+        measured.value(original, unit=_UNIT)
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        [_VALUE, _UNIT],
+        [measured.sequence([_VALUE], _UNIT)],
+        [measured.sequence([[_VALUE]], _UNIT)],
+        [numpy.array([[_VALUE]]), _UNIT],
+        [[_VALUE], _UNIT],
+        [[[_VALUE]], _UNIT],
+    ],
+)
+def test_factory_valid(args):
+    """Test valid arguments to the measured-value factory."""
+    assert measured.value(*args) == measured.value(_VALUE, unit=_UNIT)
+
+
+@pytest.mark.parametrize(
+    "arg",
+    [
+        measured.sequence([_VALUE, 2*_VALUE]),
+        measured.sequence([[_VALUE, 2*_VALUE]]),
+        numpy.array([[_VALUE, 2*_VALUE]]),
+        [[_VALUE, 2*_VALUE]],
+        str(_VALUE),
+        [str(_VALUE)],
+        [[str(_VALUE)]],
+    ],
+)
+def test_factory_invalid(arg):
+    """Test invalid arguments to the measured-value factory."""
+    with pytest.raises(TypeError):
+        measured.value(arg)
 
 
@@ -4,21 +4,6 @@ from eprempy import symbolic
 from eprempy import metric
 
 
-def test_ratio():
-    """Test the method that computes the ratio of two units."""
-    cases = {
-        ('cm', 'm'): 1e-2,
-        ('m', 'cm'): 1e2,
-        ('cm', 'cm'): 1.0,
-        ('km', 'm'): 1e3,
-        ('m', 'km'): 1e-3,
-    }
-    for (u0, u1), result in cases.items():
-        assert metric.ratio(u0, u1) == result
-    with pytest.raises(ValueError):
-        metric.ratio('cm', 'J')
-
-
 def test_identify():
     """Test the ability to identify arbitrary named units.
 
@@ -101,7 +86,7 @@ def test_unitlike():
         assert not metric.unitlike(this)
 
 
-@pytest.mark.xfail
+@pytest.mark.xfail(run=False, reason="metric.reduction is not implemented")
 def test_decomposition():
     """Test the module-level unit-decomposing function."""
     cases = {
@@ -6,7 +6,21 @@ from eprempy import symbolic
 from eprempy import metric
 
 
-def test_build_named_unit():
+@pytest.fixture(scope='session')
+def named_units():
+    """Named-unit instances for every unit symbol in this module's cases."""
+    symbols = {
+        'm', 'cm', 'km', 'au',
+        's',
+        'kg', 'g',
+        'N', 'dyn',
+        'J', 'mJ', 'erg', 'merg', 'kerg', 'eV', 'MeV',
+        'ohm',
+    }
+    return {symbol: metric.NamedUnit(symbol) for symbol in symbols}
+
+
+def test_build_named_unit(named_units: dict):
     cases = {
         'm': {
             'name': 'meter',
@@ -28,14 +42,14 @@ def test_build_named_unit():
         },
     }
     for name, attrs in cases.items():
-        unit = metric.NamedUnit(name)
+        unit = named_units[name]
         for key, value in attrs.items():
             assert getattr(unit, key) == value
     with pytest.raises(metric.UnitParsingError):
         metric.NamedUnit('cat')
 
 
-def test_named_unit_dimensions():
+def test_named_unit_dimensions(named_units: dict):
     """Test the dimensions attribute of a NamedUnit."""
     cases = {
         'm': {'mks': 'L', 'cgs': 'L'},
@@ -47,53 +61,57 @@ def test_named_unit_dimensions():
         'MeV': {'mks': '(M * L^2) / T^2', 'cgs': '(M * L^2) / T^2'},
     }
     for unit, dimensions in cases.items():
-        named = metric.NamedUnit(unit)
-        assert named.dimensions == dimensions
-        named.dimensions.pop('mks')
-        named.dimensions.pop('cgs')
-        named.dimensions['foo'] = 'bar'
+        named = named_units[unit]
         assert named.dimensions == dimensions
+        # each access returns a copy of the internal dict
+        assert named.dimensions is not named.dimensions
 
 
-def test_named_unit_conversion_factor():
-    """Calling u0 >> u1 should compute the numerical conversion factor."""
-    cases = {
-        ('cm', 'm'): 1e-2,
-        ('m', 'cm'): 1e+2,
-        ('cm', 'cm'): 1.0,
-        ('km', 'm'): 1e+3,
-        ('m', 'km'): 1e-3,
-    }
-    for (s0, s1), expected in cases.items():
-        u0 = metric.NamedUnit(s0)
-        u1 = metric.NamedUnit(s1)
-        # defined between instances
-        u0_u1 = u0 >> u1
-        assert u0_u1 == pytest.approx(expected)
-        u1_u0 = u0 << u1
-        assert u1_u0 == pytest.approx(1.0 / expected)
-        # defined for instance >> string and string << instance
-        u0_s1 = u0 >> s1
-        assert u0_s1 == pytest.approx(expected)
-        s1_u0 = u0 << s1
-        assert s1_u0 == pytest.approx(1.0 / expected)
-        # defined for string >> instance and instance << string
-        s0_u1 = s0 >> u1
-        assert s0_u1 == pytest.approx(expected)
-        u1_s0 = s0 << u1
-        assert u1_s0 == pytest.approx(1.0 / expected)
+_LENGTH_RATIOS = (
+    ('cm', 'm', 1e-2),
+    ('m', 'cm', 1e+2),
+    ('cm', 'cm', 1.0),
+    ('km', 'm', 1e+3),
+    ('m', 'km', 1e-3),
+)
+"""Length-unit pairs and the magnitude of the first relative to the second."""
+
+
+@pytest.mark.parametrize("s0,s1,expected", _LENGTH_RATIOS)
+def test_named_unit_ratio(
+    named_units: dict,
+    s0: str,
+    s1: str,
+    expected: float,
+) -> None:
+    """Unit ratios should agree with the named-unit shift operators."""
+    forward = metric.ratio(s0, s1)
+    assert forward == expected
+    reverse = metric.ratio(s1, s0)
+    assert reverse == pytest.approx(1.0 / forward)
+    u0 = named_units[s0]
+    u1 = named_units[s1]
+    # defined between instances, for instance >> string and string << instance,
+    # and for string >> instance and instance << string
+    for this, that in ((u0, u1), (u0, s1), (s0, u1)):
+        assert this >> that == forward
+        assert this << that == reverse
+
+
+def test_named_unit_ratio_errors(named_units: dict):
+    """Unit ratios are not defined for different base units."""
+    with pytest.raises(ValueError):
+        metric.ratio('cm', 'J')
+    with pytest.raises(ValueError):
+        named_units['m'] >> named_units['J']
     with pytest.raises(ValueError):
-        u0 = metric.NamedUnit('m')
-        u1 = metric.NamedUnit('J')
-        # not defined for different base units
-        u0 >> u1
-        u0 << u1
+        named_units['m'] << named_units['J']
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def decompositions():
     """Test cases for named-unit decompositions."""
-    return {
+    cases = {
         # fundamental in mks and cgs
         's': [{'base': 's'}],
         # fundamental in mks
@@ -134,24 +152,27 @@ def decompositions():
         'km': None,
         'au': None,
     }
+    return {
+        unit: None if terms is None else {symbolic.term(**t) for t in terms}
+        for unit, terms in cases.items()
+    }
 
 
-def test_named_unit_decompose(decompositions: dict):
+def test_named_unit_decompose(decompositions: dict, named_units: dict):
     """Test the NamedUnit.decompose method."""
     for unit, expected in decompositions.items():
-        named = metric.NamedUnit(unit)
+        named = named_units[unit]
         result = named.decomposed
         if expected is None:
             assert result is None
         else:
-            terms = [symbolic.term(**term) for term in expected]
-            assert set(result) == set(terms)
+            assert set(result) == expected
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def reductions():
     """Test cases for named-unit reductions."""
-    return {
+    cases = {
         's': {
             'mks': {
                 'scale': 1e0,
@@ -272,6 +293,11 @@ def reductions():
             'cgs': None,
         },
     }
+    for systems in cases.values():
+        for case in systems.values():
+            if case is not None:
+                case['terms'] = {symbolic.term(**t) for t in case['terms']}
+    return cases
 
 
 def test_reduction_class():
@@ -302,7 +328,7 @@ def test_reduction_class():
         3 ** this
 
 
-def test_named_unit_norm():
+def test_named_unit_norm(named_units: dict):
     """A named unit should know its canonical equivalents."""
     cases = {
         'm': {
@@ -339,17 +365,18 @@ def test_named_unit_norm():
         },
     }
     for unit, systems in cases.items():
-        named = metric.NamedUnit(unit)
+        named = named_units[unit]
         for system, expected in systems.items():
             assert named.norm[system] == expected
 
 
 def test_named_unit_reduce(
     reductions: typing.Dict[str, typing.Dict[str, typing.Any]],
+    named_units: dict,
 ) -> None:
     """Test the NamedUnit.reduce method."""
     for unit, systems in reductions.items():
-        named = metric.NamedUnit(unit)
+        named = named_units[unit]
         for system, expected in systems.items():
             result = named.reduce(system)
             if expected is None:
@@ -357,12 +384,12 @@ def test_named_unit_reduce(
             else:
                 assert result.system == system
                 assert result.scale == expected['scale']
-                terms = [symbolic.term(**term) for term in expected['terms']]
-                assert set(result.units) == set(terms)
+                assert set(result.units) == expected['terms']
 
 
 def test_named_unit_reduce_system(
     reductions: typing.Dict[str, typing.Dict[str, typing.Any]],
+    named_units: dict,
 ) -> None:
     """Test reductions with the default metric system."""
     these = {
@@ -375,17 +402,16 @@ def test_named_unit_reduce_system(
     }
     for unit, default in these.items():
         case = reductions[unit][default]
-        result = metric.NamedUnit(unit).reduce()
+        result = named_units[unit].reduce()
         if case is None:
             assert result is None
         else:
             assert result.system == default
-            terms = [symbolic.term(**term) for term in case['terms']]
             assert result.scale == case['scale']
-            assert set(result.units) == set(terms)
+            assert set(result.units) == case['terms']
 
 
-def test_named_unit_systems():
+def test_named_unit_systems(named_units: dict):
     """Determine which metric systems include a named unit."""
     test = {
         'm': {
@@ -420,11 +446,10 @@ def test_named_unit_systems():
         },
     }
     for unit, cases in test.items():
+        named = named_units[unit]
+        # each access returns a copy of the internal dict
+        assert named.systems is not named.systems
         for mode, expected in cases.items():
-            named = metric.NamedUnit(unit)
-            assert set(named.systems[mode]) == expected
-            named.systems.pop('allowed')
-            named.systems['foo'] = 'bar'
             assert set(named.systems[mode]) == expected
 
 
@@ -11,7 +11,7 @@ from eprempy import quantity
 def test_implicitly_measurable(measurables):
     """Test the function that determines if we can measure an object."""
     true = [
-        *[case['test'] for case in measurables],
+        *[case.test for case in measurables],
         0,
         1,
     ]
@@ -32,7 +32,7 @@ def test_implicitly_measurable(measurables):
 
 def test_explicitly_measurable(measurables):
     """Test the function that determines if we can measure an object."""
-    cases = [case['test'] for case in measurables]
+    cases = [case.test for case in measurables]
     for case in cases:
         assert quantity.ismeasurable(case)
     assert quantity.ismeasurable(support.Measurable(1, unit='m / s'))
@@ -41,12 +41,12 @@ def test_explicitly_measurable(measurables):
 def test_parse(measurables):
     """Test the function that attempts to parse a measurable object."""
     for case in measurables:
-        result = quantity.parse(case['test'])
-        expected = case['full']
+        result = quantity.parse(case.test)
+        expected = case.full
         assert result == expected
     for case in measurables:
-        result = quantity.parse(case['test'], distribute=True)
-        expected = case['dist']
+        result = quantity.parse(case.test, distribute=True)
+        expected = case.dist
         assert result == expected
     assert quantity.parse(0) == (0, '1') # zero is measurable!
     # assert quantity.parse(measured.value(1, 'm')) == (1, 'm')
@@ -65,10 +65,10 @@ def test_parse(measurables):
 def test_measure(measurables):
     """Test the function that creates a measurement from measurable input."""
     for case in measurables:
-        result = quantity.measure(case['test'])
+        result = quantity.measure(case.test)
         assert isinstance(result, quantity.Measurement)
-        assert tuple(result.data) == case['full'][:-1]
-        assert result.unit == case['full'][-1]
+        assert tuple(result.data) == case.full[:-1]
+        assert result.unit == case.full[-1]
         assert quantity.measure(result) is result
     expected = quantity.measurement([1], unit='m / s')
     assert quantity.measure(measured.value(1, 'm / s')) == expected
@@ -1,6 +1,8 @@
 import pytest
 import fractions
+import gc
 import typing
+import weakref
 
 from eprempy import base
 from eprempy import symbolic
@@ -147,6 +149,31 @@ def test_create_operand():
                 assert part.exponent == fractions.Fraction(ref[2])
 
 
+def test_create_operand_unbalanced():
+    """An unbalanced group should not cause evaluation of its prefix."""
+    for string in ('0^-1(', '1/0_xa('):
+        operand = symbolic.OperandFactory().create(string)
+        assert operand.base == string
+        assert symbolic.OperandFactory().create(string, strict=True) is None
+
+
+def test_create_operand_invalid_base():
+    """A malformed base inside separators should be invalid."""
+    for strict in (False, True):
+        with pytest.raises(symbolic.OperandValueError):
+            symbolic.OperandFactory().create('(^-1*)', strict=strict)
+
+
+def test_operand_factory_release():
+    """Creating operands should not keep the factory alive."""
+    factory = symbolic.OperandFactory()
+    assert factory.create('2a^3') == symbolic.OperandFactory().create('2a^3')
+    ref = weakref.ref(factory)
+    del factory
+    gc.collect()
+    assert ref() is None
+
+
 def test_find_bounds():
     """Test OperandFactory.find_bounds."""
     strings = {
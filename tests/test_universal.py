@@ -25,3 +25,29 @@ def test_constant_asscalar():
             assert isinstance(s, physical.Scalar)
             assert float(c) == float(s)
 
+
+def test_constants_arrays():
+    """Test bulk access to constant values and names by quantity."""
+    for system in ('mks', 'cgs'):
+        mapping = universal.Constants(system)
+        values = mapping.values_array()
+        assert len(values) == len(mapping)
+        for name, value in zip(mapping, values):
+            assert value == float(mapping[name])
+    assert universal.MKS.by_quantity('mass') == ('me', 'mp', 'amu')
+    assert universal.CGS.by_quantity('length') == ('a0', 're', 'au')
+    assert universal.MKS.by_quantity('not a quantity') == ()
+
+
+def test_show(capsys):
+    """Test the function that prints all defined constants."""
+    universal.show()
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[:4] == [
+        "'pi': The ratio of a circle's circumference to its diameter.",
+        "\tmks: 3.141592653589793",
+        "\tcgs: 3.141592653589793",
+        "",
+    ]
+    assert "'k': Boltzmann's constant." in lines
+    assert "\tmks: 1.3807e-23 [J / K]" in lines